@@ -5,6 +5,8 @@ from __future__ import annotations
 import json
 import logging
 import os
+import stat
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
@@ -26,6 +28,40 @@ BINARY_VECTORS_MMAP_NAME = "_binary_vectors.mmap"
 
 log = logging.getLogger(__name__)
 
+# Accepted values when validating settings.json and .env overrides
+_EMBEDDING_BACKENDS = frozenset({"fastembed", "litellm"})
+_RERANKER_BACKENDS = frozenset({"fastembed", "onnx", "api", "litellm", "legacy"})
+_CASCADE_STRATEGIES = frozenset({"binary", "binary_rerank", "dense_rerank", "staged"})
+_LOAD_BALANCE_STRATEGIES = frozenset({"round_robin", "latency_aware", "weighted_random"})
+_STAGE2_MODES = frozenset({"precomputed", "realtime", "static_global_graph"})
+_CLUSTERING_STRATEGIES = frozenset(
+    {"auto", "hdbscan", "dbscan", "frequency", "noop", "score", "dir_rr", "path"}
+)
+_TRUTHY_VALUES = frozenset({"true", "1", "yes", "on"})
+
+# Numeric .env overrides: (variable, Config attribute, parser)
+_NUMERIC_ENV_OVERRIDES = (
+    ("CASCADE_COARSE_K", "cascade_coarse_k", int),
+    ("CASCADE_FINE_K", "cascade_fine_k", int),
+    ("EMBEDDING_COOLDOWN", "embedding_cooldown", float),
+    ("RERANKER_COOLDOWN", "reranker_cooldown", float),
+    ("RERANKER_MAX_INPUT_TOKENS", "reranker_max_input_tokens", int),
+    ("RERANKER_TEST_FILE_PENALTY", "reranker_test_file_penalty", float),
+    ("STAGED_CLUSTERING_MIN_SIZE", "staged_clustering_min_size", int),
+    ("STAGED_REALTIME_LSP_TIMEOUT_S", "staged_realtime_lsp_timeout_s", float),
+    ("STAGED_REALTIME_LSP_DEPTH", "staged_realtime_lsp_depth", int),
+    ("STAGED_REALTIME_LSP_MAX_NODES", "staged_realtime_lsp_max_nodes", int),
+    ("STAGED_REALTIME_LSP_MAX_SEEDS", "staged_realtime_lsp_max_seeds", int),
+    ("STAGED_REALTIME_LSP_MAX_CONCURRENT", "staged_realtime_lsp_max_concurrent", int),
+    ("STAGED_REALTIME_LSP_WARMUP_S", "staged_realtime_lsp_warmup_s", float),
+)
+
+# Workspace index databases confirmed present, keyed to the mtime of their
+# .codexlens directory (creating or removing the database changes it).
+# Least recently checked entries are evicted past the cap.
+_WORKSPACE_INDEX_SEEN: OrderedDict[Path, int] = OrderedDict()
+_WORKSPACE_INDEX_SEEN_MAX = 256
+
 
 def _default_global_dir() -> Path:
     """Get global CodexLens data directory."""
@@ -269,6 +305,11 @@ class Config:
         """Path to the settings file."""
         return self.data_dir / SETTINGS_FILE_NAME
 
+    @cached_property
+    def env_path(self) -> Path:
+        """Path to the .env file holding configuration overrides."""
+        return self.data_dir / ".env"
+
     def save_settings(self) -> None:
         """Save embedding and other settings to file."""
         embedding_config = {
@@ -332,7 +373,7 @@ class Config:
                     # Support 'api' as alias for 'litellm'
                     if backend == "api":
                         backend = "litellm"
-                    if backend in {"fastembed", "litellm"}:
+                    if backend in _EMBEDDING_BACKENDS:
                         self.embedding_backend = backend
                     else:
                         log.warning(
@@ -372,7 +413,7 @@ class Config:
                     self.enable_cross_encoder_rerank = reranker["enabled"]
                 if "backend" in reranker:
                     backend = reranker["backend"]
-                    if backend in {"fastembed", "onnx", "api", "litellm", "legacy"}:
+                    if backend in _RERANKER_BACKENDS:
                         self.reranker_backend = backend
                     else:
                         log.warning(
@@ -397,7 +438,7 @@ class Config:
                 cascade = settings.get("cascade", {})
                 if "strategy" in cascade:
                     strategy = cascade["strategy"]
-                    if strategy in {"binary", "binary_rerank", "dense_rerank", "staged"}:
+                    if strategy in _CASCADE_STRATEGIES:
                         self.cascade_strategy = strategy
                     else:
                         log.warning(
@@ -455,57 +496,43 @@ class Config:
         """
         from .env_config import load_env_file
 
-        env_vars = load_env_file(self.data_dir / ".env")
+        # load_env_file stats the file once and returns {} when it is absent;
+        # most installs have no .env, so the whole override phase is skipped.
+        env_vars = load_env_file(self.env_path)
         if not env_vars:
             return
 
+        # Applied overrides are collected and logged once at the end
+        applied: List[tuple[str, Any]] = []
+
         def get_env(key: str) -> str | None:
             """Get env var with or without CODEXLENS_ prefix."""
             # Check prefixed version first (Dashboard format), then unprefixed
             return env_vars.get(f"CODEXLENS_{key}") or env_vars.get(key)
 
         def _parse_bool(value: str) -> bool:
-            return value.strip().lower() in {"true", "1", "yes", "on"}
+            return value.strip().lower() in _TRUTHY_VALUES
 
         # Cascade overrides
         cascade_enabled = get_env("ENABLE_CASCADE_SEARCH")
         if cascade_enabled:
             self.enable_cascade_search = _parse_bool(cascade_enabled)
-            log.debug(
-                "Overriding enable_cascade_search from .env: %s",
-                self.enable_cascade_search,
-            )
+            applied.append(("enable_cascade_search", self.enable_cascade_search))
 
         cascade_strategy = get_env("CASCADE_STRATEGY")
         if cascade_strategy:
             strategy = cascade_strategy.strip().lower()
-            if strategy in {"binary", "binary_rerank", "dense_rerank", "staged"}:
+            if strategy in _CASCADE_STRATEGIES:
                 self.cascade_strategy = strategy
-                log.debug("Overriding cascade_strategy from .env: %s", self.cascade_strategy)
+                applied.append(("cascade_strategy", self.cascade_strategy))
             else:
                 log.warning("Invalid CASCADE_STRATEGY in .env: %r", cascade_strategy)
 
-        cascade_coarse_k = get_env("CASCADE_COARSE_K")
-        if cascade_coarse_k:
-            try:
-                self.cascade_coarse_k = int(cascade_coarse_k)
-                log.debug("Overriding cascade_coarse_k from .env: %s", self.cascade_coarse_k)
-            except ValueError:
-                log.warning("Invalid CASCADE_COARSE_K in .env: %r", cascade_coarse_k)
-
-        cascade_fine_k = get_env("CASCADE_FINE_K")
-        if cascade_fine_k:
-            try:
-                self.cascade_fine_k = int(cascade_fine_k)
-                log.debug("Overriding cascade_fine_k from .env: %s", self.cascade_fine_k)
-            except ValueError:
-                log.warning("Invalid CASCADE_FINE_K in .env: %r", cascade_fine_k)
-
         # Embedding overrides
         embedding_model = get_env("EMBEDDING_MODEL")
         if embedding_model:
             self.embedding_model = embedding_model
-            log.debug("Overriding embedding_model from .env: %s", self.embedding_model)
+            applied.append(("embedding_model", self.embedding_model))
 
         embedding_backend = get_env("EMBEDDING_BACKEND")
         if embedding_backend:
@@ -513,102 +540,70 @@ class Config:
             # Support 'api' as alias for 'litellm'
             if backend == "api":
                 backend = "litellm"
-            if backend in {"fastembed", "litellm"}:
+            if backend in _EMBEDDING_BACKENDS:
                 self.embedding_backend = backend
-                log.debug("Overriding embedding_backend from .env: %s", backend)
+                applied.append(("embedding_backend", backend))
             else:
                 log.warning("Invalid EMBEDDING_BACKEND in .env: %r", embedding_backend)
 
         embedding_pool = get_env("EMBEDDING_POOL_ENABLED")
         if embedding_pool:
             value = embedding_pool.lower()
-            self.embedding_pool_enabled = value in {"true", "1", "yes", "on"}
-            log.debug("Overriding embedding_pool_enabled from .env: %s", self.embedding_pool_enabled)
+            self.embedding_pool_enabled = value in _TRUTHY_VALUES
+            applied.append(("embedding_pool_enabled", self.embedding_pool_enabled))
 
         embedding_strategy = get_env("EMBEDDING_STRATEGY")
         if embedding_strategy:
             strategy = embedding_strategy.lower()
-            if strategy in {"round_robin", "latency_aware", "weighted_random"}:
+            if strategy in _LOAD_BALANCE_STRATEGIES:
                 self.embedding_strategy = strategy
-                log.debug("Overriding embedding_strategy from .env: %s", strategy)
+                applied.append(("embedding_strategy", strategy))
             else:
                 log.warning("Invalid EMBEDDING_STRATEGY in .env: %r", embedding_strategy)
 
-        embedding_cooldown = get_env("EMBEDDING_COOLDOWN")
-        if embedding_cooldown:
-            try:
-                self.embedding_cooldown = float(embedding_cooldown)
-                log.debug("Overriding embedding_cooldown from .env: %s", self.embedding_cooldown)
-            except ValueError:
-                log.warning("Invalid EMBEDDING_COOLDOWN in .env: %r", embedding_cooldown)
-
         # Reranker overrides
         reranker_model = get_env("RERANKER_MODEL")
         if reranker_model:
             self.reranker_model = reranker_model
-            log.debug("Overriding reranker_model from .env: %s", self.reranker_model)
+            applied.append(("reranker_model", self.reranker_model))
 
         reranker_backend = get_env("RERANKER_BACKEND")
         if reranker_backend:
             backend = reranker_backend.lower()
-            if backend in {"fastembed", "onnx", "api", "litellm", "legacy"}:
+            if backend in _RERANKER_BACKENDS:
                 self.reranker_backend = backend
-                log.debug("Overriding reranker_backend from .env: %s", backend)
+                applied.append(("reranker_backend", backend))
             else:
                 log.warning("Invalid RERANKER_BACKEND in .env: %r", reranker_backend)
 
         reranker_enabled = get_env("RERANKER_ENABLED")
         if reranker_enabled:
             value = reranker_enabled.lower()
-            self.enable_cross_encoder_rerank = value in {"true", "1", "yes", "on"}
-            log.debug("Overriding reranker_enabled from .env: %s", self.enable_cross_encoder_rerank)
+            self.enable_cross_encoder_rerank = value in _TRUTHY_VALUES
+            applied.append(("enable_cross_encoder_rerank", self.enable_cross_encoder_rerank))
 
         reranker_pool = get_env("RERANKER_POOL_ENABLED")
         if reranker_pool:
             value = reranker_pool.lower()
-            self.reranker_pool_enabled = value in {"true", "1", "yes", "on"}
-            log.debug("Overriding reranker_pool_enabled from .env: %s", self.reranker_pool_enabled)
+            self.reranker_pool_enabled = value in _TRUTHY_VALUES
+            applied.append(("reranker_pool_enabled", self.reranker_pool_enabled))
 
         reranker_strategy = get_env("RERANKER_STRATEGY")
         if reranker_strategy:
             strategy = reranker_strategy.lower()
-            if strategy in {"round_robin", "latency_aware", "weighted_random"}:
+            if strategy in _LOAD_BALANCE_STRATEGIES:
                 self.reranker_strategy = strategy
-                log.debug("Overriding reranker_strategy from .env: %s", strategy)
+                applied.append(("reranker_strategy", strategy))
             else:
                 log.warning("Invalid RERANKER_STRATEGY in .env: %r", reranker_strategy)
 
-        reranker_cooldown = get_env("RERANKER_COOLDOWN")
-        if reranker_cooldown:
-            try:
-                self.reranker_cooldown = float(reranker_cooldown)
-                log.debug("Overriding reranker_cooldown from .env: %s", self.reranker_cooldown)
-            except ValueError:
-                log.warning("Invalid RERANKER_COOLDOWN in .env: %r", reranker_cooldown)
-
-        reranker_max_tokens = get_env("RERANKER_MAX_INPUT_TOKENS")
-        if reranker_max_tokens:
-            try:
-                self.reranker_max_input_tokens = int(reranker_max_tokens)
-                log.debug("Overriding reranker_max_input_tokens from .env: %s", self.reranker_max_input_tokens)
-            except ValueError:
-                log.warning("Invalid RERANKER_MAX_INPUT_TOKENS in .env: %r", reranker_max_tokens)
-
         # Reranker tuning from environment
-        test_penalty = get_env("RERANKER_TEST_FILE_PENALTY")
-        if test_penalty:
-            try:
-                self.reranker_test_file_penalty = float(test_penalty)
-                log.debug("Overriding reranker_test_file_penalty from .env: %s", self.reranker_test_file_penalty)
-            except ValueError:
-                log.warning("Invalid RERANKER_TEST_FILE_PENALTY in .env: %r", test_penalty)
-
         docstring_weight = get_env("RERANKER_DOCSTRING_WEIGHT")
         if docstring_weight:
             try:
                 weight = float(docstring_weight)
                 self.reranker_chunk_type_weights = {"code": 1.0, "docstring": weight}
-                log.debug("Overriding reranker docstring weight from .env: %s", weight)
+                applied.append(("reranker_chunk_type_weights", self.reranker_chunk_type_weights))
             except ValueError:
                 log.warning("Invalid RERANKER_DOCSTRING_WEIGHT in .env: %r", docstring_weight)
 
@@ -616,142 +611,66 @@ class Config:
         strip_comments = get_env("CHUNK_STRIP_COMMENTS")
         if strip_comments:
             self.chunk_strip_comments = strip_comments.lower() in ("true", "1", "yes")
-            log.debug("Overriding chunk_strip_comments from .env: %s", self.chunk_strip_comments)
+            applied.append(("chunk_strip_comments", self.chunk_strip_comments))
 
         strip_docstrings = get_env("CHUNK_STRIP_DOCSTRINGS")
         if strip_docstrings:
             self.chunk_strip_docstrings = strip_docstrings.lower() in ("true", "1", "yes")
-            log.debug("Overriding chunk_strip_docstrings from .env: %s", self.chunk_strip_docstrings)
+            applied.append(("chunk_strip_docstrings", self.chunk_strip_docstrings))
 
         # Staged cascade overrides
         staged_stage2_mode = get_env("STAGED_STAGE2_MODE")
         if staged_stage2_mode:
             mode = staged_stage2_mode.strip().lower()
-            if mode in {"precomputed", "realtime", "static_global_graph"}:
+            if mode in _STAGE2_MODES:
                 self.staged_stage2_mode = mode
-                log.debug("Overriding staged_stage2_mode from .env: %s", self.staged_stage2_mode)
+                applied.append(("staged_stage2_mode", self.staged_stage2_mode))
             elif mode in {"live"}:
                 self.staged_stage2_mode = "realtime"
-                log.debug("Overriding staged_stage2_mode from .env: %s", self.staged_stage2_mode)
+                applied.append(("staged_stage2_mode", self.staged_stage2_mode))
             else:
                 log.warning("Invalid STAGED_STAGE2_MODE in .env: %r", staged_stage2_mode)
 
         staged_clustering_strategy = get_env("STAGED_CLUSTERING_STRATEGY")
         if staged_clustering_strategy:
             strategy = staged_clustering_strategy.strip().lower()
-            if strategy in {"auto", "hdbscan", "dbscan", "frequency", "noop", "score", "dir_rr", "path"}:
+            if strategy in _CLUSTERING_STRATEGIES:
                 self.staged_clustering_strategy = strategy
-                log.debug(
-                    "Overriding staged_clustering_strategy from .env: %s",
-                    self.staged_clustering_strategy,
-                )
+                applied.append(("staged_clustering_strategy", self.staged_clustering_strategy))
             elif strategy in {"none", "off"}:
                 self.staged_clustering_strategy = "noop"
-                log.debug(
-                    "Overriding staged_clustering_strategy from .env: %s",
-                    self.staged_clustering_strategy,
-                )
+                applied.append(("staged_clustering_strategy", self.staged_clustering_strategy))
             else:
                 log.warning(
                     "Invalid STAGED_CLUSTERING_STRATEGY in .env: %r",
                     staged_clustering_strategy,
                 )
 
-        staged_clustering_min_size = get_env("STAGED_CLUSTERING_MIN_SIZE")
-        if staged_clustering_min_size:
-            try:
-                self.staged_clustering_min_size = int(staged_clustering_min_size)
-                log.debug(
-                    "Overriding staged_clustering_min_size from .env: %s",
-                    self.staged_clustering_min_size,
-                )
-            except ValueError:
-                log.warning(
-                    "Invalid STAGED_CLUSTERING_MIN_SIZE in .env: %r",
-                    staged_clustering_min_size,
-                )
-
         enable_staged_rerank = get_env("ENABLE_STAGED_RERANK")
         if enable_staged_rerank:
             self.enable_staged_rerank = _parse_bool(enable_staged_rerank)
-            log.debug("Overriding enable_staged_rerank from .env: %s", self.enable_staged_rerank)
+            applied.append(("enable_staged_rerank", self.enable_staged_rerank))
 
-        rt_timeout = get_env("STAGED_REALTIME_LSP_TIMEOUT_S")
-        if rt_timeout:
-            try:
-                self.staged_realtime_lsp_timeout_s = float(rt_timeout)
-                log.debug(
-                    "Overriding staged_realtime_lsp_timeout_s from .env: %s",
-                    self.staged_realtime_lsp_timeout_s,
-                )
-            except ValueError:
-                log.warning("Invalid STAGED_REALTIME_LSP_TIMEOUT_S in .env: %r", rt_timeout)
-
-        rt_depth = get_env("STAGED_REALTIME_LSP_DEPTH")
-        if rt_depth:
-            try:
-                self.staged_realtime_lsp_depth = int(rt_depth)
-                log.debug(
-                    "Overriding staged_realtime_lsp_depth from .env: %s",
-                    self.staged_realtime_lsp_depth,
-                )
-            except ValueError:
-                log.warning("Invalid STAGED_REALTIME_LSP_DEPTH in .env: %r", rt_depth)
-
-        rt_max_nodes = get_env("STAGED_REALTIME_LSP_MAX_NODES")
-        if rt_max_nodes:
-            try:
-                self.staged_realtime_lsp_max_nodes = int(rt_max_nodes)
-                log.debug(
-                    "Overriding staged_realtime_lsp_max_nodes from .env: %s",
-                    self.staged_realtime_lsp_max_nodes,
-                )
-            except ValueError:
-                log.warning("Invalid STAGED_REALTIME_LSP_MAX_NODES in .env: %r", rt_max_nodes)
-
-        rt_max_seeds = get_env("STAGED_REALTIME_LSP_MAX_SEEDS")
-        if rt_max_seeds:
-            try:
-                self.staged_realtime_lsp_max_seeds = int(rt_max_seeds)
-                log.debug(
-                    "Overriding staged_realtime_lsp_max_seeds from .env: %s",
-                    self.staged_realtime_lsp_max_seeds,
-                )
-            except ValueError:
-                log.warning("Invalid STAGED_REALTIME_LSP_MAX_SEEDS in .env: %r", rt_max_seeds)
-
-        rt_max_concurrent = get_env("STAGED_REALTIME_LSP_MAX_CONCURRENT")
-        if rt_max_concurrent:
-            try:
-                self.staged_realtime_lsp_max_concurrent = int(rt_max_concurrent)
-                log.debug(
-                    "Overriding staged_realtime_lsp_max_concurrent from .env: %s",
-                    self.staged_realtime_lsp_max_concurrent,
-                )
-            except ValueError:
-                log.warning(
-                    "Invalid STAGED_REALTIME_LSP_MAX_CONCURRENT in .env: %r",
-                    rt_max_concurrent,
-                )
+        rt_resolve = get_env("STAGED_REALTIME_LSP_RESOLVE_SYMBOLS")
+        if rt_resolve:
+            self.staged_realtime_lsp_resolve_symbols = _parse_bool(rt_resolve)
+            applied.append(("staged_realtime_lsp_resolve_symbols", self.staged_realtime_lsp_resolve_symbols))
 
-        rt_warmup = get_env("STAGED_REALTIME_LSP_WARMUP_S")
-        if rt_warmup:
+        # Numeric overrides share one parse-and-validate path
+        for env_key, attr, parser in _NUMERIC_ENV_OVERRIDES:
+            raw_value = get_env(env_key)
+            if not raw_value:
+                continue
             try:
-                self.staged_realtime_lsp_warmup_s = float(rt_warmup)
-                log.debug(
-                    "Overriding staged_realtime_lsp_warmup_s from .env: %s",
-                    self.staged_realtime_lsp_warmup_s,
-                )
+                value = parser(raw_value)
             except ValueError:
-                log.warning("Invalid STAGED_REALTIME_LSP_WARMUP_S in .env: %r", rt_warmup)
+                log.warning("Invalid %s in .env: %r", env_key, raw_value)
+                continue
+            setattr(self, attr, value)
+            applied.append((attr, value))
 
-        rt_resolve = get_env("STAGED_REALTIME_LSP_RESOLVE_SYMBOLS")
-        if rt_resolve:
-            self.staged_realtime_lsp_resolve_symbols = _parse_bool(rt_resolve)
-            log.debug(
-                "Overriding staged_realtime_lsp_resolve_symbols from .env: %s",
-                self.staged_realtime_lsp_resolve_symbols,
-            )
+        if applied and log.isEnabledFor(logging.DEBUG):
+            log.debug("Applied .env overrides from %s: %s", self.env_path, applied)
 
     @classmethod
     def load(cls) -> "Config":
@@ -836,8 +755,36 @@ class WorkspaceConfig:
             raise ConfigError(f"Failed to initialize workspace at {self.codexlens_dir}: {exc}") from exc
 
     def exists(self) -> bool:
-        """Check if workspace is already initialized."""
-        return self.codexlens_dir.is_dir() and self.db_path.exists()
+        """Check if workspace is already initialized.
+
+        A confirmed index database is remembered against the .codexlens
+        directory mtime, so repeated checks cost a single stat until the
+        directory changes. Missing databases are never remembered.
+
+        On filesystems with coarse mtime resolution, a database deleted within
+        the same timestamp tick as the last positive check leaves the
+        directory mtime unchanged and is still reported as present until the
+        directory changes again.
+        """
+        try:
+            dir_stat = self.codexlens_dir.stat()
+        except OSError:
+            return False
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            return False
+
+        db_path = self.db_path
+        if _WORKSPACE_INDEX_SEEN.get(db_path) == dir_stat.st_mtime_ns:
+            _WORKSPACE_INDEX_SEEN.move_to_end(db_path)
+            return True
+        if not db_path.exists():
+            _WORKSPACE_INDEX_SEEN.pop(db_path, None)
+            return False
+        _WORKSPACE_INDEX_SEEN[db_path] = dir_stat.st_mtime_ns
+        _WORKSPACE_INDEX_SEEN.move_to_end(db_path)
+        if len(_WORKSPACE_INDEX_SEEN) > _WORKSPACE_INDEX_SEEN_MAX:
+            _WORKSPACE_INDEX_SEEN.popitem(last=False)
+        return True
 
     @classmethod
     def from_path(cls, path: Path) -> Optional["WorkspaceConfig"]:
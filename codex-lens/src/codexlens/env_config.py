@@ -13,11 +13,48 @@ from __future__ import annotations
 
 import logging
 import os
+import re
+import stat
+import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 log = logging.getLogger(__name__)
 
+# (mtime_ns, size) of a .env file when it was parsed
+_FileSignature = Tuple[int, int]
+
+# Entries kept per cache below; the least recently used one is evicted first
+_ENV_CACHE_MAX = 64
+
+# Parsed .env files keyed by path, reused while the file signature is unchanged
+_ENV_FILE_CACHE: OrderedDict[Path, Tuple[_FileSignature, Dict[str, str]]] = OrderedDict()
+
+# Merged workspace env keyed by (global .env path, workspace root)
+_WORKSPACE_ENV_CACHE: OrderedDict[
+    Tuple[Path, Path], Tuple[Tuple[Optional[_FileSignature], ...], Dict[str, str]]
+] = OrderedDict()
+
+# .env candidate paths keyed by (global .env path, workspace root)
+_WORKSPACE_ENV_SOURCES: OrderedDict[Tuple[Path, Path], Tuple[Path, Path, Path]] = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Any:
+    """Return a cached value (or None), marking it most recently used."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any) -> None:
+    """Store a value, evicting the least recently used entry past the cap."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > _ENV_CACHE_MAX:
+        cache.popitem(last=False)
+
 # Supported environment variables with descriptions
 ENV_VARS = {
     # Reranker configuration (overrides settings.json)
@@ -70,60 +107,104 @@ ENV_VARS = {
 }
 
 
+# One assignment per line: optional "export", KEY=VALUE, with the value
+# optionally wrapped in matching quotes. Comment and blank lines never match.
+_ENV_LINE_RE = re.compile(
+    r"""
+    ^[^\S\n]*(?:export[^\S\n]+)?
+    (?P<key>[^\s\#=][^=\n]*?)[^\S\n]*=[^\S\n]*
+    (?:"(?P<dq>[^\n]*)"|'(?P<sq>[^\n]*)'|(?P<raw>[^\n]*?))
+    [^\S\n]*$
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+
+# Enum-like values repeated across .env files; interned so every parsed
+# dict shares one object and equality checks hit the identity fast path.
+_INTERNED_ENV_VALUES = frozenset({
+    "true", "false", "1", "0", "yes", "no", "on", "off",
+    "round_robin", "latency_aware", "weighted_random",
+    "fastembed", "litellm", "onnx", "api", "legacy",
+    "siliconflow", "openai", "cohere", "jina",
+})
+
+
+def _env_match_item(match: re.Match[str]) -> tuple[str, str]:
+    """Return (key, value) for an _ENV_LINE_RE match, with keys interned."""
+    value = match.group("dq")
+    if value is None:
+        value = match.group("sq")
+    if value is None:
+        value = match.group("raw")
+    if value in _INTERNED_ENV_VALUES:
+        value = sys.intern(value)
+    return sys.intern(match.group("key")), value
+
+
 def _parse_env_line(line: str) -> tuple[str, str] | None:
     """Parse a single .env line, returning (key, value) or None."""
-    line = line.strip()
-    
-    # Skip empty lines and comments
-    if not line or line.startswith("#"):
+    match = _ENV_LINE_RE.match(line.strip())
+    if match is None:
         return None
-    
-    # Handle export prefix
-    if line.startswith("export "):
-        line = line[7:].strip()
-    
-    # Split on first =
-    if "=" not in line:
+    return _env_match_item(match)
+
+
+def _file_signature(path: Path) -> Optional[_FileSignature]:
+    """Return (mtime_ns, size) for a regular file, or None if it is absent."""
+    try:
+        st = path.stat()
+    except OSError:
         return None
-    
-    key, _, value = line.partition("=")
-    key = key.strip()
-    value = value.strip()
-    
-    # Remove surrounding quotes
-    if len(value) >= 2:
-        if (value.startswith('"') and value.endswith('"')) or \
-           (value.startswith("'") and value.endswith("'")):
-            value = value[1:-1]
-    
-    return key, value
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_env_file(env_path: Path, signature: _FileSignature) -> Dict[str, str]:
+    """Parse a .env file, reusing the cached result while it is unchanged.
+
+    The returned dict is shared with the cache and must not be mutated.
+    """
+    cached = _cache_get(_ENV_FILE_CACHE, env_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        content = env_path.read_text(encoding="utf-8")
+        # Single sweep over the file; dict() consumes matches without a line list
+        env_vars: Dict[str, str] = dict(map(_env_match_item, _ENV_LINE_RE.finditer(content)))
+    except Exception as exc:
+        log.warning("Failed to load .env file %s: %s", env_path, exc)
+        return {}
+
+    _cache_put(_ENV_FILE_CACHE, env_path, (signature, env_vars))
+    return env_vars
 
 
 def load_env_file(env_path: Path) -> Dict[str, str]:
     """Load environment variables from a .env file.
-    
+
+    Parsed files are cached by path and re-read only when their
+    modification time or size changes.
+
     Args:
         env_path: Path to .env file
         
     Returns:
         Dictionary of environment variables
     """
-    if not env_path.is_file():
+    signature = _file_signature(env_path)
+    if signature is None:
         return {}
-    
-    env_vars: Dict[str, str] = {}
-    
-    try:
-        content = env_path.read_text(encoding="utf-8")
-        for line in content.splitlines():
-            result = _parse_env_line(line)
-            if result:
-                key, value = result
-                env_vars[key] = value
-    except Exception as exc:
-        log.warning("Failed to load .env file %s: %s", env_path, exc)
-    
-    return env_vars
+    return dict(_read_env_file(env_path, signature))
+
+
+def clear_env_cache() -> None:
+    """Drop all cached .env parse results."""
+    _ENV_FILE_CACHE.clear()
+    _WORKSPACE_ENV_CACHE.clear()
+    _WORKSPACE_ENV_SOURCES.clear()
 
 
 def _get_global_data_dir() -> Path:
@@ -162,32 +243,43 @@ def load_workspace_env(workspace_root: Path | None = None) -> Dict[str, str]:
     Returns:
         Merged dictionary of environment variables
     """
+    return dict(_load_workspace_env_cached(workspace_root))
+
+
+def _load_workspace_env_cached(workspace_root: Path | None = None) -> Dict[str, str]:
+    """Return the merged workspace env shared with the cache (do not mutate)."""
     if workspace_root is None:
         workspace_root = Path.cwd()
 
     workspace_root = Path(workspace_root).resolve()
+    global_env_path = _get_global_data_dir() / ".env"
 
-    env_vars: Dict[str, str] = {}
+    cache_key = (global_env_path, workspace_root)
+    sources = _cache_get(_WORKSPACE_ENV_SOURCES, cache_key)
+    if sources is None:
+        # Lowest to highest priority: global, project root, .codexlens
+        sources = (
+            global_env_path,
+            workspace_root / ".env",
+            workspace_root / ".codexlens" / ".env",
+        )
+        _cache_put(_WORKSPACE_ENV_SOURCES, cache_key, sources)
 
-    # Load from global ~/.codexlens/.env (lowest priority)
-    global_vars = load_global_env()
-    if global_vars:
-        env_vars.update(global_vars)
+    signatures = tuple(_file_signature(path) for path in sources)
 
-    # Load from project root .env (medium priority)
-    root_env = workspace_root / ".env"
-    if root_env.is_file():
-        loaded = load_env_file(root_env)
-        env_vars.update(loaded)
-        log.debug("Loaded %d vars from %s", len(loaded), root_env)
+    cached = _cache_get(_WORKSPACE_ENV_CACHE, cache_key)
+    if cached is not None and cached[0] == signatures:
+        return cached[1]
 
-    # Load from .codexlens/.env (highest priority)
-    codexlens_env = workspace_root / ".codexlens" / ".env"
-    if codexlens_env.is_file():
-        loaded = load_env_file(codexlens_env)
+    env_vars: Dict[str, str] = {}
+    for path, signature in zip(sources, signatures):
+        if signature is None:
+            continue
+        loaded = _read_env_file(path, signature)
         env_vars.update(loaded)
-        log.debug("Loaded %d vars from %s", len(loaded), codexlens_env)
+        log.debug("Loaded %d vars from %s", len(loaded), path)
 
+    _cache_put(_WORKSPACE_ENV_CACHE, cache_key, (signatures, env_vars))
     return env_vars
 
 
@@ -201,10 +293,12 @@ def apply_workspace_env(workspace_root: Path | None = None, *, override: bool =
     Returns:
         Number of variables applied
     """
-    env_vars = load_workspace_env(workspace_root)
+    env_vars = _load_workspace_env_cached(workspace_root)
     applied = 0
     
     for key, value in env_vars.items():
+        # Checked against os.environ itself: its membership is case-insensitive
+        # on Windows, which a snapshot of its keys would not be.
         if override or key not in os.environ:
             os.environ[key] = value
             applied += 1
@@ -235,11 +329,8 @@ def get_env(key: str, default: str | None = None, *, workspace_root: Path | None
         return os.environ[key]
     
     # Load from .env files
-    env_vars = load_workspace_env(workspace_root)
-    if key in env_vars:
-        return env_vars[key]
-    
-    return default
+    env_vars = _load_workspace_env_cached(workspace_root)
+    return env_vars.get(key, default)
 
 
 def get_api_config(
@@ -273,8 +364,13 @@ def get_api_config(
         "timeout": f"{prefix}_TIMEOUT",
     }
     
+    # Load .env files once for all fields; os.environ still wins per key
+    env_vars = _load_workspace_env_cached(workspace_root)
+
     for field, env_key in field_mapping.items():
-        value = get_env(env_key, workspace_root=workspace_root)
+        value = os.environ.get(env_key)
+        if value is None:
+            value = env_vars.get(env_key)
         if value is not None:
             # Type conversion for specific fields
             if field == "timeout":
@@ -290,12 +386,8 @@ def get_api_config(
     return config
 
 
-def generate_env_example() -> str:
-    """Generate .env.example content with all supported variables.
-    
-    Returns:
-        String content for .env.example file
-    """
+def _build_env_example() -> str:
+    """Render .env.example content from ENV_VARS, grouped by key prefix."""
     lines = [
         "# CodexLens Environment Configuration",
         "# Copy this file to .codexlens/.env and fill in your values",
@@ -318,3 +410,16 @@ def generate_env_example() -> str:
         lines.append("")
     
     return "\n".join(lines)
+
+
+# ENV_VARS is fixed at import, so the example is rendered once
+_ENV_EXAMPLE_CONTENT = _build_env_example()
+
+
+def generate_env_example() -> str:
+    """Generate .env.example content with all supported variables.
+    
+    Returns:
+        String content for .env.example file
+    """
+    return _ENV_EXAMPLE_CONTENT
@@ -7,14 +7,60 @@ interface and behavior in minimal environments.
 
 from __future__ import annotations
 
+import logging
+import os
 import re
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Protocol
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
 
 from codexlens.config import Config
 from codexlens.entities import CodeRelationship, IndexedFile, RelationshipType, Symbol
-from codexlens.parsers.treesitter_parser import TreeSitterSymbolParser
+from codexlens.parsers.treesitter_parser import (
+    TREE_SITTER_AVAILABLE,
+    TreeSitterSymbolParser,
+    resolve_source_file,
+)
+
+log = logging.getLogger(__name__)
+
+# Languages routed through tree-sitter; empty when tree-sitter is not installed
+# so callers skip constructing parsers that can never become available.
+_TREE_SITTER_LANGUAGES = (
+    frozenset({"python", "javascript", "typescript"}) if TREE_SITTER_AVAILABLE else frozenset()
+)
+
+
+# Upper bound on parsers a ParserFactory keeps; least recently used are evicted
+_MAX_CACHED_PARSERS = 32
+
+# Files shorter than this many characters are parsed in-process even when a
+# process pool is requested; pickling them would cost more than parsing.
+_INLINE_PARSE_MAX_CHARS = 4 * 1024
+
+# Per-thread tree-sitter parsers; a tree-sitter Parser must not be shared
+# between threads that parse concurrently (see ParserFactory.parse_many).
+_TREE_SITTER_PARSERS = threading.local()
+
+
+def _get_tree_sitter_parser(language_id: str, path: Optional[Path] = None) -> TreeSitterSymbolParser:
+    """Return this thread's cached tree-sitter parser for a language and suffix."""
+    parsers: Optional[Dict[Tuple[str, str], TreeSitterSymbolParser]] = getattr(_TREE_SITTER_PARSERS, "parsers", None)
+    if parsers is None:
+        parsers = _TREE_SITTER_PARSERS.parsers = {}
+
+    # The suffix only matters for grammar selection (e.g. .tsx)
+    key = (language_id, path.suffix.lower() if path is not None else "")
+    parser = parsers.get(key)
+    if parser is None:
+        parser = parsers[key] = TreeSitterSymbolParser(language_id, path)
+    return parser
 
 
 class Parser(Protocol):
@@ -27,20 +73,21 @@ class SimpleRegexParser:
 
     def parse(self, text: str, path: Path) -> IndexedFile:
         # Try tree-sitter first for supported languages
-        if self.language_id in {"python", "javascript", "typescript"}:
-            ts_parser = TreeSitterSymbolParser(self.language_id, path)
+        if self.language_id in _TREE_SITTER_LANGUAGES:
+            ts_parser = _get_tree_sitter_parser(self.language_id, path)
             if ts_parser.is_available():
                 indexed = ts_parser.parse(text, path)
                 if indexed is not None:
                     return indexed
 
-        # Fallback to regex parsing
+        # Fallback to regex parsing; every relationship shares one interned path
+        source_file = resolve_source_file(path)
         if self.language_id == "python":
             symbols = _parse_python_symbols_regex(text)
-            relationships = _parse_python_relationships_regex(text, path)
+            relationships = _parse_python_relationships_regex(text, path, source_file)
         elif self.language_id in {"javascript", "typescript"}:
             symbols = _parse_js_ts_symbols_regex(text)
-            relationships = _parse_js_ts_relationships_regex(text, path)
+            relationships = _parse_js_ts_relationships_regex(text, path, source_file)
         elif self.language_id == "java":
             symbols = _parse_java_symbols(text)
             relationships = []
@@ -58,7 +105,7 @@ class SimpleRegexParser:
             relationships = []
 
         return IndexedFile(
-            path=str(path.resolve()),
+            path=source_file,
             language=self.language_id,
             symbols=symbols,
             chunks=[],
@@ -69,31 +116,166 @@ class SimpleRegexParser:
 class ParserFactory:
     def __init__(self, config: Config) -> None:
         self.config = config
-        self._parsers: Dict[str, Parser] = {}
+        self._parsers: OrderedDict[str, Parser] = OrderedDict()
+        # Process pool kept across parse_many batches; created on first use
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_workers = 0
+        self._process_pool_finalizer: Optional[weakref.finalize] = None
 
     def get_parser(self, language_id: str) -> Parser:
-        if language_id not in self._parsers:
-            self._parsers[language_id] = SimpleRegexParser(language_id)
-        return self._parsers[language_id]
+        parser = self._parsers.get(language_id)
+        if parser is not None:
+            self._parsers.move_to_end(language_id)
+            return parser
+
+        parser = self._parsers[language_id] = SimpleRegexParser(language_id)
+        if len(self._parsers) > _MAX_CACHED_PARSERS:
+            evicted, _ = self._parsers.popitem(last=False)
+            log.debug("Evicted cached parser for %s", evicted)
+        return parser
+
+    def _get_process_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Return the shared process pool, recreating it if the size changed."""
+        if self._process_pool is None or self._process_pool_workers != workers:
+            self.close()
+            pool = ProcessPoolExecutor(max_workers=workers)
+            self._process_pool = pool
+            self._process_pool_workers = workers
+            # Shuts the pool down when the factory is collected or at exit
+            self._process_pool_finalizer = weakref.finalize(self, pool.shutdown)
+        return self._process_pool
+
+    def close(self) -> None:
+        """Shut down the process pool used by parse_many, if one was started."""
+        finalizer = self._process_pool_finalizer
+        self._process_pool = None
+        self._process_pool_workers = 0
+        self._process_pool_finalizer = None
+        if finalizer is not None:
+            finalizer()
+
+    def parse_many(
+        self,
+        files: Iterable[Tuple[str, str, Path]],
+        *,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+    ) -> List[IndexedFile]:
+        """Parse many files, spreading the work over a thread or process pool.
+
+        Tree-sitter releases the GIL while building syntax trees, so parsing
+        a batch of files concurrently overlaps the native parse work. The
+        Python-side tree walks and regex fallbacks still hold the GIL; set
+        ``use_processes`` to run them on all cores for large batches. The
+        process pool is kept on the factory and reused across calls (see
+        ``close``); files under ``_INLINE_PARSE_MAX_CHARS`` are parsed on the
+        calling thread since IPC would outweigh their parse work.
+
+        Args:
+            files: (language_id, text, path) tuples
+            max_workers: Worker count (default: CPU count)
+            use_processes: Use a process pool instead of threads
+
+        Returns:
+            IndexedFile results in the same order as ``files``
+        """
+        items = list(files)
+        pool_size = max_workers or os.cpu_count() or 1
+
+        if use_processes and pool_size > 1:
+            pooled = [i for i, (_, text, _) in enumerate(items) if len(text) >= _INLINE_PARSE_MAX_CHARS]
+            if len(pooled) > 1:
+                return self._parse_many_in_processes(items, pooled, pool_size)
+
+        workers = min(pool_size, len(items))
+
+        # Fetch parsers once on this thread; worker threads only read this
+        # local dict and never touch the LRU cache, which get_parser reorders.
+        parsers = {language_id: self.get_parser(language_id) for language_id, _, _ in items}
+
+        def parse_one(item: Tuple[str, str, Path]) -> IndexedFile:
+            language_id, text, path = item
+            return parsers[language_id].parse(text, path)
+
+        if workers <= 1:
+            return [parse_one(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(parse_one, items))
+
+    def _parse_many_in_processes(
+        self,
+        items: List[Tuple[str, str, Path]],
+        pooled: List[int],
+        pool_size: int,
+    ) -> List[IndexedFile]:
+        """Send the items at ``pooled`` to the process pool, parse the rest here.
+
+        A pool whose worker died is discarded and the batch is retried once on
+        a fresh pool; a second failure propagates.
+        """
+        workers = min(pool_size, len(pooled))
+        chunksize = max(1, len(pooled) // (4 * workers))
+        pooled_set = set(pooled)
+        inline: Optional[Dict[int, IndexedFile]] = None
+        for attempt in range(2):
+            pool = self._get_process_pool(pool_size)
+            try:
+                # map() submits everything up front, so small files are parsed
+                # on this thread while the workers handle the large ones.
+                pooled_results = pool.map(_parse_file_worker, [items[i] for i in pooled], chunksize=chunksize)
+                if inline is None:
+                    inline = {
+                        index: self.get_parser(language_id).parse(text, path)
+                        for index, (language_id, text, path) in enumerate(items)
+                        if index not in pooled_set
+                    }
+                pooled_list = list(pooled_results)
+            except BrokenProcessPool:
+                self.close()
+                if attempt:
+                    raise
+                log.warning("Parser process pool broke; retrying on a new pool")
+            else:
+                break
+
+        # ``pooled`` is ascending, so pool results come back in item order
+        pooled_iter = iter(pooled_list)
+        return [inline[index] if index in inline else next(pooled_iter) for index in range(len(items))]
+
+
+def _parse_file_worker(item: Tuple[str, str, Path]) -> IndexedFile:
+    """Parse one (language_id, text, path) item in a worker process."""
+    language_id, text, path = item
+    return SimpleRegexParser(language_id).parse(text, path)
 
 
 # Regex-based fallback parsers
-_PY_CLASS_RE = re.compile(r"^\s*class\s+([A-Za-z_]\w*)\b")
-_PY_DEF_RE = re.compile(r"^\s*(?:async\s+)?def\s+([A-Za-z_]\w*)\s*\(")
+# Class and def headers fused into one alternation so each line costs a single
+# match attempt; exactly one of the "cls"/"fn" groups is set on success.
+_PY_SCOPE_RE = re.compile(
+    r"^\s*(?:class\s+(?P<cls>[A-Za-z_]\w*)\b"
+    r"|(?:async\s+)?def\s+(?P<fn>[A-Za-z_]\w*)\s*\()"
+)
 
 _PY_IMPORT_RE = re.compile(r"^(?:from\s+([\w.]+)\s+)?import\s+([\w.,\s]+)")
 _PY_CALL_RE = re.compile(r"(?<![.\w])(\w+)\s*\(")
+# Keywords and common builtins that look like calls but are not worth recording
+_PY_CALL_SKIP = frozenset(
+    {"if", "for", "while", "return", "print", "len", "str", "int", "float", "list", "dict", "set", "tuple"}
+)
 
 
 
 
 def _parse_python_symbols(text: str) -> List[Symbol]:
     """Parse Python symbols, using tree-sitter if available, regex fallback."""
-    ts_parser = TreeSitterSymbolParser("python")
-    if ts_parser.is_available():
-        symbols = ts_parser.parse_symbols(text)
-        if symbols is not None:
-            return symbols
+    if "python" in _TREE_SITTER_LANGUAGES:
+        ts_parser = _get_tree_sitter_parser("python")
+        if ts_parser.is_available():
+            symbols = ts_parser.parse_symbols(text)
+            if symbols is not None:
+                return symbols
     return _parse_python_symbols_regex(text)
 
 
@@ -103,11 +285,12 @@ def _parse_js_ts_symbols(
     path: Optional[Path] = None,
 ) -> List[Symbol]:
     """Parse JS/TS symbols, using tree-sitter if available, regex fallback."""
-    ts_parser = TreeSitterSymbolParser(language_id, path)
-    if ts_parser.is_available():
-        symbols = ts_parser.parse_symbols(text)
-        if symbols is not None:
-            return symbols
+    if language_id in _TREE_SITTER_LANGUAGES:
+        ts_parser = _get_tree_sitter_parser(language_id, path)
+        if ts_parser.is_available():
+            symbols = ts_parser.parse_symbols(text)
+            if symbols is not None:
+                return symbols
     return _parse_js_ts_symbols_regex(text)
 
 
@@ -115,16 +298,16 @@ def _parse_python_symbols_regex(text: str) -> List[Symbol]:
     symbols: List[Symbol] = []
     current_class_indent: Optional[int] = None
     for i, line in enumerate(text.splitlines(), start=1):
-        class_match = _PY_CLASS_RE.match(line)
-        if class_match:
-            current_class_indent = len(line) - len(line.lstrip(" "))
-            symbols.append(Symbol(name=class_match.group(1), kind="class", range=(i, i)))
-            continue
-        def_match = _PY_DEF_RE.match(line)
-        if def_match:
+        scope_match = _PY_SCOPE_RE.match(line)
+        if scope_match:
+            class_name = scope_match.group("cls")
+            if class_name:
+                current_class_indent = len(line) - len(line.lstrip(" "))
+                symbols.append(Symbol(name=class_name, kind="class", range=(i, i)))
+                continue
             indent = len(line) - len(line.lstrip(" "))
             kind = "method" if current_class_indent is not None and indent > current_class_indent else "function"
-            symbols.append(Symbol(name=def_match.group(1), kind=kind, range=(i, i)))
+            symbols.append(Symbol(name=scope_match.group("fn"), kind=kind, range=(i, i)))
             continue
         if current_class_indent is not None:
             indent = len(line) - len(line.lstrip(" "))
@@ -133,26 +316,28 @@ def _parse_python_symbols_regex(text: str) -> List[Symbol]:
     return symbols
 
 
-def _parse_python_relationships_regex(text: str, path: Path) -> List[CodeRelationship]:
+def _parse_python_relationships_regex(
+    text: str,
+    path: Path,
+    source_file: Optional[str] = None,
+) -> List[CodeRelationship]:
     relationships: List[CodeRelationship] = []
     current_scope: str | None = None
-    source_file = str(path.resolve())
+    if source_file is None:
+        source_file = resolve_source_file(path)
 
     for line_num, line in enumerate(text.splitlines(), start=1):
-        class_match = _PY_CLASS_RE.match(line)
-        if class_match:
-            current_scope = class_match.group(1)
-            continue
-
-        def_match = _PY_DEF_RE.match(line)
-        if def_match:
-            current_scope = def_match.group(1)
+        scope_match = _PY_SCOPE_RE.match(line)
+        if scope_match:
+            current_scope = sys.intern(scope_match.group("cls") or scope_match.group("fn"))
             continue
 
         if current_scope is None:
             continue
 
-        import_match = _PY_IMPORT_RE.search(line)
+        # Cheap substring checks before running the import and call patterns;
+        # most lines are neither imports nor contain a call.
+        import_match = _PY_IMPORT_RE.match(line) if line.startswith(("from", "import")) else None
         if import_match:
             import_target = import_match.group(1) or import_match.group(2)
             if import_target:
@@ -167,29 +352,16 @@ def _parse_python_relationships_regex(text: str, path: Path) -> List[CodeRelatio
                     )
                 )
 
+        if "(" not in line:
+            continue
         for call_match in _PY_CALL_RE.finditer(line):
             call_name = call_match.group(1)
-            if call_name in {
-                "if",
-                "for",
-                "while",
-                "return",
-                "print",
-                "len",
-                "str",
-                "int",
-                "float",
-                "list",
-                "dict",
-                "set",
-                "tuple",
-                current_scope,
-            }:
+            if call_name in _PY_CALL_SKIP or call_name == current_scope:
                 continue
             relationships.append(
                 CodeRelationship(
                     source_symbol=current_scope,
-                    target_symbol=call_name,
+                    target_symbol=sys.intern(call_name),
                     relationship_type=RelationshipType.CALL,
                     source_file=source_file,
                     target_file=None,
@@ -200,43 +372,56 @@ def _parse_python_relationships_regex(text: str, path: Path) -> List[CodeRelatio
     return relationships
 
 
-_JS_FUNC_RE = re.compile(r"^\s*(?:export\s+)?(?:async\s+)?function\s+([A-Za-z_$][\w$]*)\s*\(")
-_JS_CLASS_RE = re.compile(r"^\s*(?:export\s+)?class\s+([A-Za-z_$][\w$]*)\b")
-_JS_ARROW_RE = re.compile(
-    r"^\s*(?:export\s+)?(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*=\s*(?:async\s*)?\(?[^)]*\)?\s*=>"
+# Class, function and arrow-function headers share the "export" prefix and are
+# told apart by keyword, so one alternation replaces three per-line matches.
+# "base" captures an optional "extends Base" clause so inheritance comes from
+# the same match as the class declaration.
+_JS_SCOPE_RE = re.compile(
+    r"^\s*(?:export\s+)?(?:"
+    r"class\s+(?P<cls>[A-Za-z_$][\w$]*)\b"
+    r"(?:\s*<[^>]*>)?(?:\s+extends\s+(?P<base>[A-Za-z_$][\w$.]*))?"
+    r"|(?:async\s+)?function\s+(?P<fn>[A-Za-z_$][\w$]*)\s*\("
+    r"|(?:const|let|var)\s+(?P<arrow>[A-Za-z_$][\w$]*)\s*=\s*(?:async\s*)?\(?[^)]*\)?\s*=>"
+    r")"
 )
 _JS_METHOD_RE = re.compile(r"^\s+(?:async\s+)?([A-Za-z_$][\w$]*)\s*\([^)]*\)\s*\{")
-_JS_IMPORT_RE = re.compile(r"import\s+.*\s+from\s+['\"]([^'\"]+)['\"]")
+# ES imports (with or without bindings) and CommonJS require() in one pass.
+# Side-effect imports must start a statement so that string literals such as
+# 'run import "x"' are not mistaken for them.
+# ASCII mode is safe here since no identifier is captured; module specifiers
+# are matched by the quote-delimited class either way.
+_JS_IMPORT_RE = re.compile(
+    r"(?:(?:^|;)\s*import\s+|\bimport\s+.*\s+from\s+)['\"]([^'\"]+)['\"]"
+    r"|\brequire\s*\(\s*['\"]([^'\"]+)['\"]\s*\)",
+    re.ASCII,
+)
 _JS_CALL_RE = re.compile(r"(?<![.\w])(\w+)\s*\(")
 
 
 def _parse_js_ts_symbols_regex(text: str) -> List[Symbol]:
     symbols: List[Symbol] = []
     in_class = False
+    # Brace depth relative to the current class header; only the balance since
+    # that line matters, so braces are not counted outside classes.
     class_brace_depth = 0
-    brace_depth = 0
 
     for i, line in enumerate(text.splitlines(), start=1):
-        brace_depth += line.count("{") - line.count("}")
-
-        class_match = _JS_CLASS_RE.match(line)
-        if class_match:
-            symbols.append(Symbol(name=class_match.group(1), kind="class", range=(i, i)))
+        scope_match = _JS_SCOPE_RE.match(line)
+        class_name = scope_match.group("cls") if scope_match else None
+        if class_name:
+            symbols.append(Symbol(name=class_name, kind="class", range=(i, i)))
             in_class = True
-            class_brace_depth = brace_depth
+            class_brace_depth = 0
             continue
 
-        if in_class and brace_depth < class_brace_depth:
-            in_class = False
-
-        func_match = _JS_FUNC_RE.match(line)
-        if func_match:
-            symbols.append(Symbol(name=func_match.group(1), kind="function", range=(i, i)))
-            continue
+        if in_class:
+            class_brace_depth += line.count("{") - line.count("}")
+            if class_brace_depth < 0:
+                in_class = False
 
-        arrow_match = _JS_ARROW_RE.match(line)
-        if arrow_match:
-            symbols.append(Symbol(name=arrow_match.group(1), kind="function", range=(i, i)))
+        if scope_match:
+            name = scope_match.group("fn") or scope_match.group("arrow")
+            symbols.append(Symbol(name=name, kind="function", range=(i, i)))
             continue
 
         if in_class:
@@ -249,36 +434,49 @@ def _parse_js_ts_symbols_regex(text: str) -> List[Symbol]:
     return symbols
 
 
-def _parse_js_ts_relationships_regex(text: str, path: Path) -> List[CodeRelationship]:
+def _parse_js_ts_relationships_regex(
+    text: str,
+    path: Path,
+    source_file: Optional[str] = None,
+) -> List[CodeRelationship]:
     relationships: List[CodeRelationship] = []
     current_scope: str | None = None
-    source_file = str(path.resolve())
+    if source_file is None:
+        source_file = resolve_source_file(path)
+    # Most files without these literals have no imports; skip the per-line search
+    has_imports = "import" in text or "require" in text
 
     for line_num, line in enumerate(text.splitlines(), start=1):
-        class_match = _JS_CLASS_RE.match(line)
-        if class_match:
-            current_scope = class_match.group(1)
-            continue
-
-        func_match = _JS_FUNC_RE.match(line)
-        if func_match:
-            current_scope = func_match.group(1)
-            continue
-
-        arrow_match = _JS_ARROW_RE.match(line)
-        if arrow_match:
-            current_scope = arrow_match.group(1)
+        scope_match = _JS_SCOPE_RE.match(line)
+        if scope_match:
+            class_name = scope_match.group("cls")
+            if not class_name:
+                current_scope = sys.intern(scope_match.group("fn") or scope_match.group("arrow"))
+                continue
+            current_scope = sys.intern(class_name)
+            base_class = scope_match.group("base")
+            if base_class:
+                relationships.append(
+                    CodeRelationship(
+                        source_symbol=current_scope,
+                        target_symbol=base_class,
+                        relationship_type=RelationshipType.INHERITS,
+                        source_file=source_file,
+                        target_file=None,
+                        source_line=line_num,
+                    )
+                )
             continue
 
         if current_scope is None:
             continue
 
-        import_match = _JS_IMPORT_RE.search(line)
+        import_match = _JS_IMPORT_RE.search(line) if has_imports else None
         if import_match:
             relationships.append(
                 CodeRelationship(
                     source_symbol=current_scope,
-                    target_symbol=import_match.group(1),
+                    target_symbol=import_match.group(1) or import_match.group(2),
                     relationship_type=RelationshipType.IMPORTS,
                     source_file=source_file,
                     target_file=None,
@@ -286,14 +484,16 @@ def _parse_js_ts_relationships_regex(text: str, path: Path) -> List[CodeRelation
                 )
             )
 
+        if "(" not in line:
+            continue
         for call_match in _JS_CALL_RE.finditer(line):
             call_name = call_match.group(1)
-            if call_name in {current_scope}:
+            if call_name == current_scope:
                 continue
             relationships.append(
                 CodeRelationship(
                     source_symbol=current_scope,
-                    target_symbol=call_name,
+                    target_symbol=sys.intern(call_name),
                     relationship_type=RelationshipType.CALL,
                     source_file=source_file,
                     target_file=None,
@@ -323,42 +523,61 @@ def _parse_java_symbols(text: str) -> List[Symbol]:
     return symbols
 
 
-_GO_FUNC_RE = re.compile(r"^\s*func\s+(?:\([^)]+\)\s+)?([A-Za-z_]\w*)\s*\(")
-_GO_TYPE_RE = re.compile(r"^\s*type\s+([A-Za-z_]\w*)\s+(?:struct|interface)\b")
+def _iter_line_matches(pattern: re.Pattern[str], text: str) -> Iterator[Tuple[int, re.Match[str]]]:
+    """Yield (line_number, match) for a MULTILINE pattern scanned over the whole text.
+
+    Line numbers are counted from "\n" between consecutive matches, so the text
+    is never split into a list of lines. Patterns must not match across "\n".
+    """
+    line_num = 1
+    last_pos = 0
+    for match in pattern.finditer(text):
+        start = match.start()
+        line_num += text.count("\n", last_pos, start)
+        last_pos = start
+        yield line_num, match
+
+
+# The stateless fallbacks below scan the whole text with one MULTILINE pattern;
+# "[^\S\n]" is whitespace other than newline so no match spans two lines.
+_GO_SYMBOL_RE = re.compile(
+    r"^[^\S\n]*(?:type[^\S\n]+(?P<type>[A-Za-z_]\w*)[^\S\n]+(?:struct|interface)\b"
+    r"|func[^\S\n]+(?:\([^)\n]+\)[^\S\n]+)?(?P<func>[A-Za-z_]\w*)[^\S\n]*\()",
+    re.MULTILINE,
+)
 
 
 def _parse_go_symbols(text: str) -> List[Symbol]:
     symbols: List[Symbol] = []
-    for i, line in enumerate(text.splitlines(), start=1):
-        type_match = _GO_TYPE_RE.match(line)
-        if type_match:
-            symbols.append(Symbol(name=type_match.group(1), kind="class", range=(i, i)))
-            continue
-        func_match = _GO_FUNC_RE.match(line)
-        if func_match:
-            symbols.append(Symbol(name=func_match.group(1), kind="function", range=(i, i)))
+    for i, match in _iter_line_matches(_GO_SYMBOL_RE, text):
+        type_name = match.group("type")
+        if type_name:
+            symbols.append(Symbol(name=type_name, kind="class", range=(i, i)))
+        else:
+            symbols.append(Symbol(name=match.group("func"), kind="function", range=(i, i)))
     return symbols
 
 
-_GENERIC_DEF_RE = re.compile(r"^\s*(?:def|function|func)\s+([A-Za-z_]\w*)\b")
-_GENERIC_CLASS_RE = re.compile(r"^\s*(?:class|struct|interface)\s+([A-Za-z_]\w*)\b")
+_GENERIC_SYMBOL_RE = re.compile(
+    r"^[^\S\n]*(?:(?:class|struct|interface)[^\S\n]+(?P<cls>[A-Za-z_]\w*)\b"
+    r"|(?:def|function|func)[^\S\n]+(?P<fn>[A-Za-z_]\w*)\b)",
+    re.MULTILINE,
+)
 
 
 def _parse_generic_symbols(text: str) -> List[Symbol]:
     symbols: List[Symbol] = []
-    for i, line in enumerate(text.splitlines(), start=1):
-        class_match = _GENERIC_CLASS_RE.match(line)
-        if class_match:
-            symbols.append(Symbol(name=class_match.group(1), kind="class", range=(i, i)))
-            continue
-        def_match = _GENERIC_DEF_RE.match(line)
-        if def_match:
-            symbols.append(Symbol(name=def_match.group(1), kind="function", range=(i, i)))
+    for i, match in _iter_line_matches(_GENERIC_SYMBOL_RE, text):
+        class_name = match.group("cls")
+        if class_name:
+            symbols.append(Symbol(name=class_name, kind="class", range=(i, i)))
+        else:
+            symbols.append(Symbol(name=match.group("fn"), kind="function", range=(i, i)))
     return symbols
 
 
 # Markdown heading regex: # Heading, ## Heading, etc.
-_MD_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+_MD_HEADING_RE = re.compile(r"^(#{1,6})[^\S\n]+([^\r\n]+)", re.MULTILINE)
 
 
 def _parse_markdown_symbols(text: str) -> List[Symbol]:
@@ -367,14 +586,12 @@ def _parse_markdown_symbols(text: str) -> List[Symbol]:
     Extracts # headings as 'section' symbols with heading level as kind suffix.
     """
     symbols: List[Symbol] = []
-    for i, line in enumerate(text.splitlines(), start=1):
-        heading_match = _MD_HEADING_RE.match(line)
-        if heading_match:
-            level = len(heading_match.group(1))
-            title = heading_match.group(2).strip()
-            # Use 'section' kind with level indicator
-            kind = f"h{level}"
-            symbols.append(Symbol(name=title, kind=kind, range=(i, i)))
+    for i, heading_match in _iter_line_matches(_MD_HEADING_RE, text):
+        level = len(heading_match.group(1))
+        title = heading_match.group(2).strip()
+        # Use 'section' kind with level indicator
+        kind = f"h{level}"
+        symbols.append(Symbol(name=title, kind=kind, range=(i, i)))
     return symbols
 
 
@@ -10,8 +10,11 @@ return `None`; callers should use a regex-based fallback such as
 
 from __future__ import annotations
 
+import logging
+import sys
+from collections import ChainMap
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
 try:
     from tree_sitter import Language as TreeSitterLanguage
@@ -27,6 +30,95 @@ except ImportError:
 from codexlens.entities import CodeRelationship, IndexedFile, RelationshipType, Symbol
 from codexlens.parsers.tokenizer import get_default_tokenizer
 
+log = logging.getLogger(__name__)
+
+
+def resolve_source_file(path: Path) -> str:
+    """Return the interned, resolved path string recorded as a file's source.
+
+    Resolved once per parse and shared by every relationship of the file. Not
+    memoized across parses: each file is parsed once per indexing pass, and a
+    cached result could go stale after symlink changes.
+    """
+    return sys.intern(str(path.resolve()))
+
+
+# Import targets up to this length are interned; module names recur across
+# many files while longer strings are rarely repeated.
+_MAX_INTERNED_TARGET_LENGTH = 64
+
+# Per-statement cap on "module.name" import targets; bundled code can list
+# hundreds of names in one import. Aliases are still recorded past the cap.
+_MAX_NAMED_IMPORT_TARGETS = 64
+
+# Literals at least one of which must appear for a file to contain a symbol.
+# Relationships are only recorded inside such scopes, so files without any of
+# them produce empty results and are not parsed at all.
+_SCOPE_LITERALS: Dict[str, tuple[str, ...]] = {
+    "python": ("def", "class"),
+    "javascript": ("function", "=>", "class"),
+    "typescript": ("function", "=>", "class"),
+}
+
+# Node types the relationship visitors act on (a superset of the symbol node
+# types); every other node is only descended into.
+_PYTHON_VISITED_NODE_TYPES = frozenset({
+    "class_definition",
+    "function_definition",
+    "async_function_definition",
+    "import_statement",
+    "import_from_statement",
+    "call",
+})
+_JS_TS_VISITED_NODE_TYPES = frozenset({
+    "class_declaration",
+    "class",
+    "function_declaration",
+    "generator_function_declaration",
+    "variable_declarator",
+    "method_definition",
+    "import_declaration",
+    "import_statement",
+    "call_expression",
+})
+
+# Grammar objects keyed by grammar name, shared by all parser instances
+_LANGUAGE_CACHE: Dict[str, "TreeSitterLanguage"] = {}
+
+
+def _python_grammar() -> Any:
+    import tree_sitter_python
+    return tree_sitter_python.language()
+
+
+def _javascript_grammar() -> Any:
+    import tree_sitter_javascript
+    return tree_sitter_javascript.language()
+
+
+def _typescript_grammar() -> Any:
+    import tree_sitter_typescript
+    return tree_sitter_typescript.language_typescript()
+
+
+def _tsx_grammar() -> Any:
+    import tree_sitter_typescript
+    return tree_sitter_typescript.language_tsx()
+
+
+# Grammar loaders keyed by grammar name
+_GRAMMAR_LOADERS: Dict[str, Callable[[], Any]] = {
+    "python": _python_grammar,
+    "javascript": _javascript_grammar,
+    "typescript": _typescript_grammar,
+    "tsx": _tsx_grammar,
+}
+
+# Grammars selected by file suffix; otherwise the grammar is the language id
+_GRAMMAR_BY_LANGUAGE_SUFFIX: Dict[tuple[str, str], str] = {
+    ("typescript", ".tsx"): "tsx",
+}
+
 
 class TreeSitterSymbolParser:
     """Parser using tree-sitter for AST-level symbol extraction."""
@@ -43,6 +135,8 @@ class TreeSitterSymbolParser:
         self._parser: Optional[object] = None
         self._language: Optional[TreeSitterLanguage] = None
         self._tokenizer = get_default_tokenizer()
+        # Bound once; parsers are reused across files (see factory._get_tree_sitter_parser)
+        self._scope_literals = _SCOPE_LITERALS.get(language_id)
 
         if TREE_SITTER_AVAILABLE:
             self._initialize_parser()
@@ -53,21 +147,8 @@ class TreeSitterSymbolParser:
             return
 
         try:
-            # Load language grammar
-            if self.language_id == "python":
-                import tree_sitter_python
-                self._language = TreeSitterLanguage(tree_sitter_python.language())
-            elif self.language_id == "javascript":
-                import tree_sitter_javascript
-                self._language = TreeSitterLanguage(tree_sitter_javascript.language())
-            elif self.language_id == "typescript":
-                import tree_sitter_typescript
-                # Detect TSX files by extension
-                if self.path is not None and self.path.suffix.lower() == ".tsx":
-                    self._language = TreeSitterLanguage(tree_sitter_typescript.language_tsx())
-                else:
-                    self._language = TreeSitterLanguage(tree_sitter_typescript.language_typescript())
-            else:
+            self._language = self._load_language()
+            if self._language is None:
                 return
 
             # Create parser
@@ -82,6 +163,27 @@ class TreeSitterSymbolParser:
             self._parser = None
             self._language = None
 
+    def _load_language(self) -> Optional[TreeSitterLanguage]:
+        """Load the grammar for this parser, reusing previously built languages.
+
+        Returns:
+            Language object, or None if the language is not supported
+        """
+        suffix = self.path.suffix.lower() if self.path is not None else ""
+        grammar = _GRAMMAR_BY_LANGUAGE_SUFFIX.get((self.language_id, suffix), self.language_id)
+
+        language = _LANGUAGE_CACHE.get(grammar)
+        if language is not None:
+            return language
+
+        loader = _GRAMMAR_LOADERS.get(grammar)
+        if loader is None:
+            return None
+
+        language = TreeSitterLanguage(loader())
+        _LANGUAGE_CACHE[grammar] = language
+        return language
+
     def is_available(self) -> bool:
         """Check if tree-sitter parser is available.
 
@@ -90,6 +192,13 @@ class TreeSitterSymbolParser:
         """
         return self._parser is not None and self._language is not None
 
+    def _may_define_scopes(self, text: str) -> bool:
+        """Cheap literal check for whether text can contain any symbol."""
+        literals = self._scope_literals
+        if literals is None:
+            return True
+        return any(literal in text for literal in literals)
+
     def _parse_tree(self, text: str) -> Optional[tuple[bytes, TreeSitterNode]]:
         if not self.is_available() or self._parser is None:
             return None
@@ -110,6 +219,9 @@ class TreeSitterSymbolParser:
         Returns:
             List of symbols if parsing succeeds, None if tree-sitter unavailable
         """
+        if self.is_available() and not self._may_define_scopes(text):
+            return []
+
         parsed = self._parse_tree(text)
         if parsed is None:
             return None
@@ -131,17 +243,30 @@ class TreeSitterSymbolParser:
         Returns:
             IndexedFile if parsing succeeds, None if tree-sitter unavailable
         """
+        if self.is_available() and not self._may_define_scopes(text):
+            return IndexedFile(
+                path=resolve_source_file(path),
+                language=self.language_id,
+                symbols=[],
+                chunks=[],
+                relationships=[],
+            )
+
         parsed = self._parse_tree(text)
         if parsed is None:
             return None
 
         source_bytes, root = parsed
         try:
-            symbols = self._extract_symbols(source_bytes, root)
-            relationships = self._extract_relationships(source_bytes, root, path)
+            # Symbols are collected during the relationship walk so the tree
+            # is only traversed once per file.
+            symbols: List[Symbol] = []
+            # Every relationship of this file shares one interned path string
+            source_file = resolve_source_file(path)
+            relationships = self._extract_relationships(source_bytes, root, source_file, symbols)
 
             return IndexedFile(
-                path=str(path.resolve()),
+                path=source_file,
                 language=self.language_id,
                 symbols=symbols,
                 chunks=[],
@@ -172,29 +297,54 @@ class TreeSitterSymbolParser:
         self,
         source_bytes: bytes,
         root: TreeSitterNode,
-        path: Path,
+        source_file: str,
+        symbols: Optional[List[Symbol]] = None,
     ) -> List[CodeRelationship]:
+        """Extract relationships from AST, optionally collecting symbols too.
+
+        Args:
+            source_bytes: Source code as bytes
+            root: Root AST node
+            source_file: Resolved file path recorded on each relationship
+            symbols: If given, symbols found during the walk are appended here
+
+        Returns:
+            List of extracted relationships
+        """
         if self.language_id == "python":
-            return self._extract_python_relationships(source_bytes, root, path)
+            return self._extract_python_relationships(source_bytes, root, source_file, symbols)
         if self.language_id in {"javascript", "typescript"}:
-            return self._extract_js_ts_relationships(source_bytes, root, path)
+            return self._extract_js_ts_relationships(source_bytes, root, source_file, symbols)
         return []
 
     def _extract_python_relationships(
         self,
         source_bytes: bytes,
         root: TreeSitterNode,
-        path: Path,
+        source_file: str,
+        symbols: Optional[List[Symbol]] = None,
     ) -> List[CodeRelationship]:
-        source_file = str(path.resolve())
         relationships: List[CodeRelationship] = []
 
         scope_stack: List[str] = []
-        alias_stack: List[Dict[str, str]] = [{}]
+        # Each scope layers its own aliases over the enclosing ones without copying
+        alias_stack: List["ChainMap[str, str]"] = [ChainMap()]
+        # Per-scope memo of resolved dotted names, reset when aliases change
+        resolved_stack: List[Dict[str, str]] = [{}]
+
+        def resolve_alias(dotted: str) -> str:
+            resolved_names = resolved_stack[-1]
+            resolved = resolved_names.get(dotted)
+            if resolved is None:
+                resolved = self._resolve_alias_dotted(dotted, alias_stack[-1])
+                resolved_names[dotted] = resolved
+            return resolved
 
         def record_import(target_symbol: str, source_line: int) -> None:
             if not target_symbol.strip() or not scope_stack:
                 return
+            if len(target_symbol) <= _MAX_INTERNED_TARGET_LENGTH:
+                target_symbol = sys.intern(target_symbol)
             relationships.append(
                 CodeRelationship(
                     source_symbol=scope_stack[-1],
@@ -237,71 +387,99 @@ class TreeSitterSymbolParser:
                 )
             )
 
-        def visit(node: TreeSitterNode) -> None:
-            pushed_scope = False
-            pushed_aliases = False
+        # Explicit stack rather than recursion so deeply nested trees cannot
+        # hit the recursion limit; None marks where a pushed scope ends.
+        stack: List[Optional[TreeSitterNode]] = [root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                alias_stack.pop()
+                resolved_stack.pop()
+                scope_stack.pop()
+                continue
 
-            if node.type in {"class_definition", "function_definition", "async_function_definition"}:
-                name_node = node.child_by_field_name("name")
-                if name_node is not None:
-                    scope_name = self._node_text(source_bytes, name_node).strip()
-                    if scope_name:
-                        scope_stack.append(scope_name)
-                        pushed_scope = True
-                        alias_stack.append(dict(alias_stack[-1]))
-                        pushed_aliases = True
-
-                if node.type == "class_definition" and pushed_scope:
-                    superclasses = node.child_by_field_name("superclasses")
-                    if superclasses is not None:
-                        for child in superclasses.children:
-                            dotted = self._python_expression_to_dotted(source_bytes, child)
-                            if not dotted:
-                                continue
-                            resolved = self._resolve_alias_dotted(dotted, alias_stack[-1])
-                            record_inherits(resolved, self._node_start_line(node))
+            node_type = node.type
+            if node_type not in _PYTHON_VISITED_NODE_TYPES:
+                stack.extend(reversed(node.children))
+                continue
+
+            pushed_scope = False
 
-            if node.type in {"import_statement", "import_from_statement"}:
+            # Every Python scope is also a symbol; reuse its decoded name
+            symbol = self._python_node_symbol(source_bytes, node)
+            if symbol is not None:
+                if symbols is not None:
+                    symbols.append(symbol)
+                scope_name = symbol.name.strip()
+                if scope_name:
+                    scope_stack.append(scope_name)
+                    pushed_scope = True
+                    alias_stack.append(alias_stack[-1].new_child())
+                    resolved_stack.append({})
+
+            if node_type == "class_definition" and pushed_scope:
+                superclasses = node.child_by_field_name("superclasses")
+                if superclasses is not None:
+                    class_line = self._node_start_line(node)
+                    for child in superclasses.children:
+                        dotted = self._python_expression_to_dotted(source_bytes, child)
+                        if not dotted:
+                            continue
+                        resolved = resolve_alias(dotted)
+                        record_inherits(resolved, class_line)
+
+            if node_type in {"import_statement", "import_from_statement"}:
                 updates, imported_targets = self._python_import_aliases_and_targets(source_bytes, node)
                 if updates:
                     alias_stack[-1].update(updates)
-                for target_symbol in imported_targets:
-                    record_import(target_symbol, self._node_start_line(node))
+                    resolved_stack[-1].clear()
+                if imported_targets:
+                    import_line = self._node_start_line(node)
+                    for target_symbol in imported_targets:
+                        record_import(target_symbol, import_line)
 
-            if node.type == "call":
+            if node_type == "call":
                 fn_node = node.child_by_field_name("function")
                 if fn_node is not None:
                     dotted = self._python_expression_to_dotted(source_bytes, fn_node)
                     if dotted:
-                        resolved = self._resolve_alias_dotted(dotted, alias_stack[-1])
+                        resolved = resolve_alias(dotted)
                         record_call(resolved, self._node_start_line(node))
 
-            for child in node.children:
-                visit(child)
-
-            if pushed_aliases:
-                alias_stack.pop()
             if pushed_scope:
-                scope_stack.pop()
+                stack.append(None)
+            stack.extend(reversed(node.children))
 
-        visit(root)
         return relationships
 
     def _extract_js_ts_relationships(
         self,
         source_bytes: bytes,
         root: TreeSitterNode,
-        path: Path,
+        source_file: str,
+        symbols: Optional[List[Symbol]] = None,
     ) -> List[CodeRelationship]:
-        source_file = str(path.resolve())
         relationships: List[CodeRelationship] = []
 
         scope_stack: List[str] = []
-        alias_stack: List[Dict[str, str]] = [{}]
+        # Each scope layers its own aliases over the enclosing ones without copying
+        alias_stack: List["ChainMap[str, str]"] = [ChainMap()]
+        # Per-scope memo of resolved dotted names, reset when aliases change
+        resolved_stack: List[Dict[str, str]] = [{}]
+
+        def resolve_alias(dotted: str) -> str:
+            resolved_names = resolved_stack[-1]
+            resolved = resolved_names.get(dotted)
+            if resolved is None:
+                resolved = self._resolve_alias_dotted(dotted, alias_stack[-1])
+                resolved_names[dotted] = resolved
+            return resolved
 
         def record_import(target_symbol: str, source_line: int) -> None:
             if not target_symbol.strip() or not scope_stack:
                 return
+            if len(target_symbol) <= _MAX_INTERNED_TARGET_LENGTH:
+                target_symbol = sys.intern(target_symbol)
             relationships.append(
                 CodeRelationship(
                     source_symbol=scope_stack[-1],
@@ -344,74 +522,58 @@ class TreeSitterSymbolParser:
                 )
             )
 
-        def visit(node: TreeSitterNode) -> None:
+        # Explicit stack rather than recursion so deeply nested trees cannot
+        # hit the recursion limit; None marks where a pushed scope ends.
+        stack: List[Optional[TreeSitterNode]] = [root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                alias_stack.pop()
+                resolved_stack.pop()
+                scope_stack.pop()
+                continue
+
+            node_type = node.type
+            if node_type not in _JS_TS_VISITED_NODE_TYPES:
+                stack.extend(reversed(node.children))
+                continue
+
             pushed_scope = False
-            pushed_aliases = False
 
-            if node.type in {"function_declaration", "generator_function_declaration"}:
-                name_node = node.child_by_field_name("name")
-                if name_node is not None:
-                    scope_name = self._node_text(source_bytes, name_node).strip()
-                    if scope_name:
-                        scope_stack.append(scope_name)
-                        pushed_scope = True
-                        alias_stack.append(dict(alias_stack[-1]))
-                        pushed_aliases = True
-
-            if node.type in {"class_declaration", "class"}:
-                name_node = node.child_by_field_name("name")
-                if name_node is not None:
-                    scope_name = self._node_text(source_bytes, name_node).strip()
-                    if scope_name:
-                        scope_stack.append(scope_name)
-                        pushed_scope = True
-                        alias_stack.append(dict(alias_stack[-1]))
-                        pushed_aliases = True
-
-                if pushed_scope:
-                    superclass = node.child_by_field_name("superclass")
-                    if superclass is not None:
-                        dotted = self._js_expression_to_dotted(source_bytes, superclass)
-                        if dotted:
-                            resolved = self._resolve_alias_dotted(dotted, alias_stack[-1])
-                            record_inherits(resolved, self._node_start_line(node))
-
-            if node.type == "variable_declarator":
-                name_node = node.child_by_field_name("name")
-                value_node = node.child_by_field_name("value")
-                if (
-                    name_node is not None
-                    and value_node is not None
-                    and name_node.type in {"identifier", "property_identifier"}
-                    and value_node.type == "arrow_function"
-                ):
-                    scope_name = self._node_text(source_bytes, name_node).strip()
-                    if scope_name:
-                        scope_stack.append(scope_name)
-                        pushed_scope = True
-                        alias_stack.append(dict(alias_stack[-1]))
-                        pushed_aliases = True
-
-            if node.type == "method_definition" and self._has_class_ancestor(node):
-                name_node = node.child_by_field_name("name")
-                if name_node is not None:
-                    scope_name = self._node_text(source_bytes, name_node).strip()
-                    if scope_name and scope_name != "constructor":
-                        scope_stack.append(scope_name)
-                        pushed_scope = True
-                        alias_stack.append(dict(alias_stack[-1]))
-                        pushed_aliases = True
-
-            if node.type in {"import_declaration", "import_statement"}:
+            # Scopes are exactly the symbol-defining nodes (classes, functions,
+            # arrow functions, non-constructor methods); reuse the symbol name.
+            symbol = self._js_ts_node_symbol(source_bytes, node)
+            if symbol is not None:
+                if symbols is not None:
+                    symbols.append(symbol)
+                scope_name = symbol.name.strip()
+                if scope_name:
+                    scope_stack.append(scope_name)
+                    pushed_scope = True
+                    alias_stack.append(alias_stack[-1].new_child())
+                    resolved_stack.append({})
+
+            if node_type in {"class_declaration", "class"} and pushed_scope:
+                superclass = node.child_by_field_name("superclass")
+                if superclass is not None:
+                    dotted = self._js_expression_to_dotted(source_bytes, superclass)
+                    if dotted:
+                        resolved = resolve_alias(dotted)
+                        record_inherits(resolved, self._node_start_line(node))
+
+            if node_type in {"import_declaration", "import_statement"}:
                 updates, imported_targets = self._js_import_aliases_and_targets(source_bytes, node)
                 if updates:
                     alias_stack[-1].update(updates)
-                for target_symbol in imported_targets:
-                    record_import(target_symbol, self._node_start_line(node))
+                    resolved_stack[-1].clear()
+                if imported_targets:
+                    import_line = self._node_start_line(node)
+                    for target_symbol in imported_targets:
+                        record_import(target_symbol, import_line)
 
             # Best-effort support for CommonJS require() imports:
             # const fs = require("fs")
-            if node.type == "variable_declarator":
+            if node_type == "variable_declarator":
                 name_node = node.child_by_field_name("name")
                 value_node = node.child_by_field_name("value")
                 if (
@@ -430,31 +592,27 @@ class TreeSitterSymbolParser:
                         module_name = self._js_first_string_argument(source_bytes, args)
                         if module_name:
                             alias_stack[-1][self._node_text(source_bytes, name_node).strip()] = module_name
+                            resolved_stack[-1].clear()
                             record_import(module_name, self._node_start_line(node))
 
-            if node.type == "call_expression":
+            if node_type == "call_expression":
                 fn_node = node.child_by_field_name("function")
                 if fn_node is not None:
                     dotted = self._js_expression_to_dotted(source_bytes, fn_node)
                     if dotted:
-                        resolved = self._resolve_alias_dotted(dotted, alias_stack[-1])
+                        resolved = resolve_alias(dotted)
                         record_call(resolved, self._node_start_line(node))
 
-            for child in node.children:
-                visit(child)
-
-            if pushed_aliases:
-                alias_stack.pop()
             if pushed_scope:
-                scope_stack.pop()
+                stack.append(None)
+            stack.extend(reversed(node.children))
 
-        visit(root)
         return relationships
 
     def _node_start_line(self, node: TreeSitterNode) -> int:
         return node.start_point[0] + 1
 
-    def _resolve_alias_dotted(self, dotted: str, aliases: Dict[str, str]) -> str:
+    def _resolve_alias_dotted(self, dotted: str, aliases: Mapping[str, str]) -> str:
         dotted = (dotted or "").strip()
         if not dotted:
             return ""
@@ -600,6 +758,7 @@ class TreeSitterSymbolParser:
                             if local:
                                 aliases[local] = module_name
                     if clause_child.type == "named_imports":
+                        named_targets = 0
                         for spec in clause_child.children:
                             if spec.type != "import_specifier":
                                 continue
@@ -616,8 +775,18 @@ class TreeSitterSymbolParser:
                                 else imported
                             )
                             if local and module_name:
-                                aliases[local] = f"{module_name}.{imported}"
-                                targets.append(f"{module_name}.{imported}")
+                                target = f"{module_name}.{imported}"
+                                aliases[local] = target
+                                named_targets += 1
+                                if named_targets <= _MAX_NAMED_IMPORT_TARGETS:
+                                    targets.append(target)
+                        if named_targets > _MAX_NAMED_IMPORT_TARGETS:
+                            log.debug(
+                                "Truncated %d named imports from %s to %d targets",
+                                named_targets,
+                                module_name,
+                                _MAX_NAMED_IMPORT_TARGETS,
+                            )
 
         return aliases, targets
 
@@ -640,27 +809,38 @@ class TreeSitterSymbolParser:
         symbols: List[Symbol] = []
 
         for node in self._iter_nodes(root):
-            if node.type == "class_definition":
-                name_node = node.child_by_field_name("name")
-                if name_node is None:
-                    continue
-                symbols.append(Symbol(
-                    name=self._node_text(source_bytes, name_node),
-                    kind="class",
-                    range=self._node_range(node),
-                ))
-            elif node.type in {"function_definition", "async_function_definition"}:
-                name_node = node.child_by_field_name("name")
-                if name_node is None:
-                    continue
-                symbols.append(Symbol(
-                    name=self._node_text(source_bytes, name_node),
-                    kind=self._python_function_kind(node),
-                    range=self._node_range(node),
-                ))
+            symbol = self._python_node_symbol(source_bytes, node)
+            if symbol is not None:
+                symbols.append(symbol)
 
         return symbols
 
+    def _python_node_symbol(self, source_bytes: bytes, node: TreeSitterNode) -> Optional[Symbol]:
+        """Build the symbol defined by a Python node, if any.
+
+        Args:
+            source_bytes: Source code as bytes
+            node: AST node
+
+        Returns:
+            Symbol for class/function definitions, None otherwise
+        """
+        if node.type == "class_definition":
+            kind = "class"
+        elif node.type in {"function_definition", "async_function_definition"}:
+            kind = self._python_function_kind(node)
+        else:
+            return None
+
+        name_node = node.child_by_field_name("name")
+        if name_node is None:
+            return None
+        return Symbol(
+            name=self._node_text(source_bytes, name_node),
+            kind=kind,
+            range=self._node_range(node),
+        )
+
     def _extract_js_ts_symbols(self, source_bytes: bytes, root: TreeSitterNode) -> List[Symbol]:
         """Extract JavaScript/TypeScript symbols from AST.
 
@@ -674,54 +854,51 @@ class TreeSitterSymbolParser:
         symbols: List[Symbol] = []
 
         for node in self._iter_nodes(root):
-            if node.type in {"class_declaration", "class"}:
-                name_node = node.child_by_field_name("name")
-                if name_node is None:
-                    continue
-                symbols.append(Symbol(
-                    name=self._node_text(source_bytes, name_node),
-                    kind="class",
-                    range=self._node_range(node),
-                ))
-            elif node.type in {"function_declaration", "generator_function_declaration"}:
-                name_node = node.child_by_field_name("name")
-                if name_node is None:
-                    continue
-                symbols.append(Symbol(
-                    name=self._node_text(source_bytes, name_node),
-                    kind="function",
-                    range=self._node_range(node),
-                ))
-            elif node.type == "variable_declarator":
-                name_node = node.child_by_field_name("name")
-                value_node = node.child_by_field_name("value")
-                if (
-                    name_node is None
-                    or value_node is None
-                    or name_node.type not in {"identifier", "property_identifier"}
-                    or value_node.type != "arrow_function"
-                ):
-                    continue
-                symbols.append(Symbol(
-                    name=self._node_text(source_bytes, name_node),
-                    kind="function",
-                    range=self._node_range(node),
-                ))
-            elif node.type == "method_definition" and self._has_class_ancestor(node):
-                name_node = node.child_by_field_name("name")
-                if name_node is None:
-                    continue
-                name = self._node_text(source_bytes, name_node)
-                if name == "constructor":
-                    continue
-                symbols.append(Symbol(
-                    name=name,
-                    kind="method",
-                    range=self._node_range(node),
-                ))
+            symbol = self._js_ts_node_symbol(source_bytes, node)
+            if symbol is not None:
+                symbols.append(symbol)
 
         return symbols
 
+    def _js_ts_node_symbol(self, source_bytes: bytes, node: TreeSitterNode) -> Optional[Symbol]:
+        """Build the symbol defined by a JavaScript/TypeScript node, if any.
+
+        Args:
+            source_bytes: Source code as bytes
+            node: AST node
+
+        Returns:
+            Symbol for classes, functions, arrow functions and methods, None otherwise
+        """
+        if node.type in {"class_declaration", "class"}:
+            kind = "class"
+        elif node.type in {"function_declaration", "generator_function_declaration"}:
+            kind = "function"
+        elif node.type == "variable_declarator":
+            value_node = node.child_by_field_name("value")
+            if value_node is None or value_node.type != "arrow_function":
+                return None
+            kind = "function"
+        elif node.type == "method_definition" and self._has_class_ancestor(node):
+            kind = "method"
+        else:
+            return None
+
+        name_node = node.child_by_field_name("name")
+        if name_node is None:
+            return None
+        if node.type == "variable_declarator" and name_node.type not in {"identifier", "property_identifier"}:
+            return None
+
+        name = self._node_text(source_bytes, name_node)
+        if kind == "method" and name == "constructor":
+            return None
+        return Symbol(
+            name=name,
+            kind=kind,
+            range=self._node_range(node),
+        )
+
     def _python_function_kind(self, node: TreeSitterNode) -> str:
         """Determine if Python function is a method or standalone function.
 
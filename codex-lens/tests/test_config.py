@@ -4,7 +4,9 @@ import builtins
 import json
 import logging
 import os
+import shutil
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
@@ -484,6 +486,39 @@ class TestWorkspaceConfig:
             workspace.db_path.write_text("")
             assert workspace.exists()
 
+    def test_exists_rechecks_after_workspace_removed(self):
+        """Test exists does not report a removed workspace as initialized."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = WorkspaceConfig(workspace_root=Path(tmpdir))
+            workspace.initialize()
+            workspace.db_path.write_text("")
+            assert workspace.exists()
+            assert workspace.exists()
+
+            shutil.rmtree(workspace.codexlens_dir)
+            assert not workspace.exists()
+
+    def test_exists_cache_is_bounded(self, monkeypatch):
+        """Test exists keeps only the most recently checked workspaces."""
+        from codexlens import config as config_module
+
+        monkeypatch.setattr(config_module, "_WORKSPACE_INDEX_SEEN", OrderedDict())
+        monkeypatch.setattr(config_module, "_WORKSPACE_INDEX_SEEN_MAX", 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspaces = []
+            for name in ("a", "b", "c"):
+                root = Path(tmpdir) / name
+                root.mkdir()
+                workspace = WorkspaceConfig(workspace_root=root)
+                workspace.initialize()
+                workspace.db_path.write_text("")
+                workspaces.append(workspace)
+
+            for workspace in workspaces:
+                assert workspace.exists()
+
+            assert list(config_module._WORKSPACE_INDEX_SEEN) == [w.db_path for w in workspaces[1:]]
+
     def test_from_path_finds_workspace(self):
         """Test from_path finds existing workspace."""
         with tempfile.TemporaryDirectory() as tmpdir:
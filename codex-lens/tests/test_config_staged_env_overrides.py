@@ -115,3 +115,28 @@ def test_staged_env_overrides_invalid_ignored(temp_config_dir: Path) -> None:
     assert config.staged_stage2_mode == "precomputed"
     assert config.staged_clustering_strategy == "auto"
     assert config.staged_realtime_lsp_timeout_s == 30.0
+
+
+def test_staged_env_overrides_logged_once(temp_config_dir: Path, caplog) -> None:
+    config = Config(data_dir=temp_config_dir)
+
+    env_path = temp_config_dir / ".env"
+    env_path.write_text(
+        "\n".join(
+            [
+                "CASCADE_STRATEGY=staged",
+                "STAGED_REALTIME_LSP_DEPTH=2",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    with caplog.at_level("DEBUG", logger="codexlens.config"):
+        config.load_settings()
+
+    override_records = [r for r in caplog.records if "overrides" in r.getMessage()]
+    assert len(override_records) == 1
+    message = override_records[0].getMessage()
+    assert "cascade_strategy" in message
+    assert "staged_realtime_lsp_depth" in message
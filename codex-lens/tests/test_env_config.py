@@ -0,0 +1,223 @@
+"""Unit tests for .env loading in codexlens.env_config."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from codexlens import env_config
+from codexlens.env_config import clear_env_cache, load_env_file, load_workspace_env
+
+
+@pytest.fixture(autouse=True)
+def isolated_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Point the global data dir at a temp dir and reset .env caches."""
+    monkeypatch.setenv("CODEXLENS_DATA_DIR", str(tmp_path / "global"))
+    clear_env_cache()
+    yield
+    clear_env_cache()
+
+
+def _rewrite(path: Path, content: str) -> None:
+    """Rewrite a file and bump its mtime so the change is always observable."""
+    path.write_text(content, encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestLoadEnvFile:
+    def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
+        assert load_env_file(tmp_path / ".env") == {}
+
+    def test_parses_quotes_comments_and_export(self, tmp_path: Path) -> None:
+        env_path = tmp_path / ".env"
+        env_path.write_text(
+            "\n".join(
+                [
+                    "# comment",
+                    "",
+                    "PLAIN=value",
+                    'DOUBLE="quoted value"',
+                    "SINGLE='single'",
+                    "export EXPORTED=1",
+                    "NO_EQUALS",
+                    "  SPACED  =  padded value  ",
+                    "URL=http://host/?a=b",
+                    'UNBALANCED="open',
+                    "EMPTY=",
+                    "WINDOWS=crlf\r",
+                ]
+            ),
+            encoding="utf-8",
+        )
+
+        assert load_env_file(env_path) == {
+            "PLAIN": "value",
+            "DOUBLE": "quoted value",
+            "SINGLE": "single",
+            "EXPORTED": "1",
+            "SPACED": "padded value",
+            "URL": "http://host/?a=b",
+            "UNBALANCED": '"open',
+            "EMPTY": "",
+            "WINDOWS": "crlf",
+        }
+
+    def test_reuses_parse_until_file_changes(self, tmp_path: Path, monkeypatch) -> None:
+        env_path = tmp_path / ".env"
+        env_path.write_text("KEY=one\n", encoding="utf-8")
+
+        calls = []
+        original = Path.read_text
+        monkeypatch.setattr(
+            Path,
+            "read_text",
+            lambda self, *args, **kwargs: calls.append(self) or original(self, *args, **kwargs),
+        )
+
+        assert load_env_file(env_path) == {"KEY": "one"}
+        assert load_env_file(env_path) == {"KEY": "one"}
+        assert len(calls) == 1
+
+        _rewrite(env_path, "KEY=two\n")
+        assert load_env_file(env_path) == {"KEY": "two"}
+
+    def test_keys_and_enum_values_are_interned(self, tmp_path: Path) -> None:
+        first = tmp_path / "a.env"
+        second = tmp_path / "b.env"
+        first.write_text("CODEXLENS_DEBUG=true\nNAME=alpha\n", encoding="utf-8")
+        second.write_text("CODEXLENS_DEBUG=true\n", encoding="utf-8")
+
+        (key_a, value_a), _ = load_env_file(first).items()
+        ((key_b, value_b),) = load_env_file(second).items()
+        assert key_a is key_b
+        assert value_a is value_b
+
+    def test_returned_dict_is_a_copy(self, tmp_path: Path) -> None:
+        env_path = tmp_path / ".env"
+        env_path.write_text("KEY=one\n", encoding="utf-8")
+
+        load_env_file(env_path)["KEY"] = "mutated"
+        assert load_env_file(env_path) == {"KEY": "one"}
+
+    def test_cache_evicts_least_recently_used(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setattr(env_config, "_ENV_CACHE_MAX", 2)
+        paths = []
+        for name in ("a", "b", "c"):
+            env_path = tmp_path / f"{name}.env"
+            env_path.write_text(f"KEY={name}\n", encoding="utf-8")
+            paths.append(env_path)
+
+        load_env_file(paths[0])
+        load_env_file(paths[1])
+        load_env_file(paths[0])
+        load_env_file(paths[2])
+        assert list(env_config._ENV_FILE_CACHE) == [paths[0], paths[2]]
+
+
+class TestLoadWorkspaceEnv:
+    def test_priority_order(self, tmp_path: Path) -> None:
+        global_dir = tmp_path / "global"
+        global_dir.mkdir()
+        (global_dir / ".env").write_text("A=global\nB=global\nC=global\n", encoding="utf-8")
+
+        workspace = tmp_path / "ws"
+        (workspace / ".codexlens").mkdir(parents=True)
+        (workspace / ".env").write_text("B=root\nC=root\n", encoding="utf-8")
+        (workspace / ".codexlens" / ".env").write_text("C=local\n", encoding="utf-8")
+
+        assert load_workspace_env(workspace) == {"A": "global", "B": "root", "C": "local"}
+
+    def test_picks_up_new_and_changed_files(self, tmp_path: Path) -> None:
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+        assert load_workspace_env(workspace) == {}
+
+        (workspace / ".env").write_text("KEY=root\n", encoding="utf-8")
+        assert load_workspace_env(workspace) == {"KEY": "root"}
+
+        _rewrite(workspace / ".env", "KEY=edit\n")
+        assert load_workspace_env(workspace) == {"KEY": "edit"}
+
+    def test_follows_retargeted_workspace_symlink(self, tmp_path: Path) -> None:
+        for name, value in (("a", "first"), ("b", "second")):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / ".env").write_text(f"KEY={value}\n", encoding="utf-8")
+        link = tmp_path / "ws"
+        try:
+            link.symlink_to(tmp_path / "a", target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        assert load_workspace_env(link) == {"KEY": "first"}
+        link.unlink()
+        link.symlink_to(tmp_path / "b", target_is_directory=True)
+        assert load_workspace_env(link) == {"KEY": "second"}
+
+
+class TestGetApiConfig:
+    def test_reads_workspace_env_once_with_environ_precedence(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        workspace = tmp_path / "ws"
+        (workspace / ".codexlens").mkdir(parents=True)
+        (workspace / ".codexlens" / ".env").write_text(
+            "\n".join(
+                [
+                    "RERANKER_API_KEY=from-file",
+                    "RERANKER_MODEL=file-model",
+                    "RERANKER_TIMEOUT=2.5",
+                ]
+            ),
+            encoding="utf-8",
+        )
+        monkeypatch.setenv("RERANKER_MODEL", "env-model")
+        monkeypatch.delenv("RERANKER_API_KEY", raising=False)
+        monkeypatch.delenv("RERANKER_TIMEOUT", raising=False)
+        monkeypatch.delenv("RERANKER_API_BASE", raising=False)
+        monkeypatch.delenv("RERANKER_PROVIDER", raising=False)
+
+        loads = []
+        original = env_config._load_workspace_env_cached
+        monkeypatch.setattr(
+            env_config,
+            "_load_workspace_env_cached",
+            lambda root=None: loads.append(root) or original(root),
+        )
+
+        config = env_config.get_api_config(
+            "RERANKER",
+            workspace_root=workspace,
+            defaults={"provider": "siliconflow"},
+        )
+
+        assert config == {
+            "api_key": "from-file",
+            "model": "env-model",
+            "provider": "siliconflow",
+            "timeout": 2.5,
+        }
+        assert len(loads) == 1
+
+
+class TestApplyWorkspaceEnv:
+    def test_respects_existing_environ_unless_override(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+        (workspace / ".env").write_text("CODEXLENS_T_SET=file\nCODEXLENS_T_NEW=file\n", encoding="utf-8")
+        monkeypatch.setenv("CODEXLENS_T_SET", "environ")
+        # setenv first so monkeypatch records the variable and removes what
+        # apply_workspace_env writes once the test finishes
+        monkeypatch.setenv("CODEXLENS_T_NEW", "")
+        monkeypatch.delenv("CODEXLENS_T_NEW")
+
+        assert env_config.apply_workspace_env(workspace) == 1
+        assert os.environ["CODEXLENS_T_SET"] == "environ"
+        assert os.environ["CODEXLENS_T_NEW"] == "file"
+
+        assert env_config.apply_workspace_env(workspace, override=True) == 2
+        assert os.environ["CODEXLENS_T_SET"] == "file"
@@ -12,8 +12,10 @@ from codexlens.parsers.factory import (
     _parse_go_symbols,
     _parse_java_symbols,
     _parse_js_ts_symbols,
+    _parse_markdown_symbols,
     _parse_python_symbols,
     _parse_generic_symbols,
+    _parse_js_ts_relationships_regex,
 )
 
 
@@ -143,6 +145,62 @@ class TestJavaScriptParser:
         assert all(name != "constructor" for name, _ in names_kinds)
 
 
+class TestJavaScriptRegexRelationships:
+    """Tests for the regex relationship fallback used without tree-sitter."""
+
+    def test_import_forms(self):
+        code = "\n".join(
+            [
+                "function main() {",
+                "  import React from 'react';",
+                "  import type { Props } from \"./types\";",
+                "  import './side-effect.css';",
+                "  const fs = require(\"fs\");",
+                "}",
+            ]
+        )
+        rels = _parse_js_ts_relationships_regex(code, Path("main.js"))
+        imports = [(r.target_symbol, r.source_line) for r in rels if r.relationship_type.value == "imports"]
+        assert imports == [
+            ("react", 2),
+            ("./types", 3),
+            ("./side-effect.css", 4),
+            ("fs", 5),
+        ]
+
+    def test_import_inside_string_literal_is_ignored(self):
+        code = "\n".join(
+            [
+                "function usage() {",
+                "  console.log('Usage: tool import \"your text\"');",
+                "  const x = 1; import 'polyfill';",
+                "}",
+            ]
+        )
+        rels = _parse_js_ts_relationships_regex(code, Path("usage.js"))
+        imports = [(r.target_symbol, r.source_line) for r in rels if r.relationship_type.value == "imports"]
+        assert imports == [("polyfill", 3)]
+
+    def test_class_extends_records_inheritance(self):
+        code = "export class Widget<T> extends ui.Base {\n}\nclass Plain {\n}"
+        rels = _parse_js_ts_relationships_regex(code, Path("widget.ts"))
+        assert [(r.source_symbol, r.target_symbol, r.relationship_type.value) for r in rels] == [
+            ("Widget", "ui.Base", "inherits"),
+        ]
+
+    def test_no_imports_without_literal(self):
+        code = "function main() {\n  helper();\n}"
+        rels = _parse_js_ts_relationships_regex(code, Path("main.js"))
+        assert [r.relationship_type.value for r in rels] == ["calls"]
+
+    def test_repeated_strings_are_shared(self):
+        code = "function main() {\n  helper();\n  helper();\n}"
+        first, second = _parse_js_ts_relationships_regex(code, Path("main.js"))
+        assert first.target_symbol is second.target_symbol
+        assert first.source_symbol is second.source_symbol
+        assert first.source_file is second.source_file
+
+
 class TestJavaParser:
     """Tests for Java symbol parsing."""
 
@@ -243,6 +301,11 @@ func (c *Config) Validate() error {
         assert "NewConfig" in names
         assert "Validate" in names
 
+    def test_line_numbers_and_no_cross_line_matches(self):
+        code = "package main\r\n\r\ntype Config\r\nstruct {}\r\n\r\nfunc Run() {}\r\n"
+        symbols = _parse_go_symbols(code)
+        assert [(s.name, s.range) for s in symbols] == [("Run", (6, 6))]
+
 
 class TestGenericParser:
     """Tests for generic symbol parsing."""
@@ -287,6 +350,24 @@ class TestGenericParser:
         assert symbols[0].name == "Drawable"
         assert symbols[0].kind == "class"
 
+    def test_line_numbers(self):
+        code = "// header\n\nclass Shape {}\n  def area():\n"
+        symbols = _parse_generic_symbols(code)
+        assert [(s.name, s.kind, s.range) for s in symbols] == [
+            ("Shape", "class", (3, 3)),
+            ("area", "function", (4, 4)),
+        ]
+
+
+class TestMarkdownParser:
+    def test_headings_with_levels_and_line_numbers(self):
+        code = "# Title\r\n\r\nintro # not a heading\r\n## Usage  \r\n# \r\n####### too deep\r\n"
+        symbols = _parse_markdown_symbols(code)
+        assert [(s.name, s.kind, s.range) for s in symbols] == [
+            ("Title", "h1", (1, 1)),
+            ("Usage", "h2", (4, 4)),
+        ]
+
 
 class TestParserInterface:
     """High-level interface tests."""
@@ -335,6 +416,26 @@ class TestParserInterface:
         # Path should be resolved to absolute
         assert Path(indexed.path).is_absolute()
 
+    def test_tree_sitter_parsers_reused_per_language_and_suffix(self):
+        from codexlens.parsers import factory
+
+        first = factory._get_tree_sitter_parser("typescript", Path("a.ts"))
+        assert factory._get_tree_sitter_parser("typescript", Path("b.ts")) is first
+        assert factory._get_tree_sitter_parser("typescript", Path("c.tsx")) is not first
+
+    def test_skips_tree_sitter_when_unavailable(self, monkeypatch):
+        from codexlens.parsers import factory
+
+        def fail(*args, **kwargs):
+            raise AssertionError("tree-sitter parser should not be constructed")
+
+        monkeypatch.setattr(factory, "_TREE_SITTER_LANGUAGES", frozenset())
+        monkeypatch.setattr(factory, "TreeSitterSymbolParser", fail)
+
+        indexed = SimpleRegexParser("python").parse("def hello():\n    pass", Path("test.py"))
+        assert [s.name for s in indexed.symbols] == ["hello"]
+        assert [s.name for s in _parse_js_ts_symbols("function test() {}")] == ["test"]
+
 
 class TestParserFactory:
     """Tests for ParserFactory."""
@@ -377,6 +478,152 @@ class TestParserFactory:
             finally:
                 del os.environ["CODEXLENS_DATA_DIR"]
 
+    def test_factory_evicts_least_recently_used_parser(self, monkeypatch):
+        from codexlens.parsers import factory as factory_module
+
+        monkeypatch.setattr(factory_module, "_MAX_CACHED_PARSERS", 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            import os
+            os.environ["CODEXLENS_DATA_DIR"] = tmpdir
+            try:
+                factory = ParserFactory(Config())
+                py_parser = factory.get_parser("python")
+                go_parser = factory.get_parser("go")
+                assert factory.get_parser("python") is py_parser
+                factory.get_parser("java")
+                assert factory.get_parser("python") is py_parser
+                assert factory.get_parser("go") is not go_parser
+            finally:
+                del os.environ["CODEXLENS_DATA_DIR"]
+
+    def test_parse_many_threads_do_not_touch_parser_cache(self, monkeypatch):
+        import threading
+        from codexlens.parsers import factory as factory_module
+
+        monkeypatch.setattr(factory_module, "_MAX_CACHED_PARSERS", 1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            import os
+            os.environ["CODEXLENS_DATA_DIR"] = tmpdir
+            try:
+                factory = ParserFactory(Config())
+                callers = set()
+                original = factory.get_parser
+                monkeypatch.setattr(
+                    factory,
+                    "get_parser",
+                    lambda language_id: callers.add(threading.get_ident()) or original(language_id),
+                )
+
+                files = [
+                    ("go", "func Run() {}", Path("run.go")),
+                    ("java", "public class Main {}", Path("Main.java")),
+                ] * 4
+                results = factory.parse_many(files, max_workers=4)
+
+                assert [r.symbols[0].name for r in results] == ["Run", "Main"] * 4
+                assert callers == {threading.get_ident()}
+            finally:
+                del os.environ["CODEXLENS_DATA_DIR"]
+
+    def test_parse_many_preserves_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            import os
+            os.environ["CODEXLENS_DATA_DIR"] = tmpdir
+            try:
+                factory = ParserFactory(Config())
+                files = [
+                    ("python", f"def func_{i}():\n    pass", Path(f"mod_{i}.py"))
+                    for i in range(8)
+                ]
+                files.append(("go", "func main() {}", Path("main.go")))
+
+                results = factory.parse_many(files, max_workers=4)
+
+                assert [r.symbols[0].name for r in results] == [
+                    *(f"func_{i}" for i in range(8)),
+                    "main",
+                ]
+                assert [r.language for r in results] == ["python"] * 8 + ["go"]
+                assert factory.parse_many([]) == []
+            finally:
+                del os.environ["CODEXLENS_DATA_DIR"]
+
+    def test_parse_many_with_processes_matches_threads(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            import os
+            os.environ["CODEXLENS_DATA_DIR"] = tmpdir
+            try:
+                factory = ParserFactory(Config())
+                # Odd files are padded past the inline limit so both paths are used
+                padding = "# filler\n" * 600
+                files = [
+                    (
+                        "python",
+                        (padding if i % 2 else "") + f"class C{i}:\n    def run(self):\n        helper()",
+                        Path(f"c_{i}.py"),
+                    )
+                    for i in range(6)
+                ]
+
+                threaded = factory.parse_many(files, max_workers=2)
+                pooled = factory.parse_many(files, max_workers=2, use_processes=True)
+                assert pooled == threaded
+
+                pool = factory._process_pool
+                assert pool is not None
+                assert factory.parse_many(files, max_workers=2, use_processes=True) == threaded
+                assert factory._process_pool is pool
+
+                factory.close()
+                assert factory._process_pool is None
+            finally:
+                del os.environ["CODEXLENS_DATA_DIR"]
+
+    def test_parse_many_recovers_from_killed_worker(self):
+        import os
+        import signal
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.environ["CODEXLENS_DATA_DIR"] = tmpdir
+            try:
+                factory = ParserFactory(Config())
+                padding = "# filler\n" * 600
+                files = [
+                    ("python", padding + f"class C{i}:\n    pass", Path(f"c_{i}.py"))
+                    for i in range(4)
+                ]
+                expected = factory.parse_many(files, max_workers=2, use_processes=True)
+
+                pool = factory._process_pool
+                worker = next(iter(pool._processes.values()))
+                os.kill(worker.pid, signal.SIGKILL)
+                worker.join(timeout=5)
+
+                assert factory.parse_many(files, max_workers=2, use_processes=True) == expected
+                assert factory._process_pool is not None
+                assert factory._process_pool is not pool
+                factory.close()
+            finally:
+                del os.environ["CODEXLENS_DATA_DIR"]
+
+    def test_parse_many_small_files_stay_in_process(self, monkeypatch):
+        from codexlens.parsers import factory as factory_module
+
+        def fail(*args, **kwargs):
+            raise AssertionError("process pool should not be started")
+
+        monkeypatch.setattr(factory_module, "ProcessPoolExecutor", fail)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            import os
+            os.environ["CODEXLENS_DATA_DIR"] = tmpdir
+            try:
+                factory = ParserFactory(Config())
+                files = [("python", "def small():\n    pass", Path(f"s_{i}.py")) for i in range(4)]
+                results = factory.parse_many(files, max_workers=2, use_processes=True)
+                assert [r.symbols[0].name for r in results] == ["small"] * 4
+            finally:
+                del os.environ["CODEXLENS_DATA_DIR"]
+
 
 class TestParserEdgeCases:
     """Edge case tests for parsers."""
@@ -141,6 +141,32 @@ def main():
         ]
         assert any(r.target_symbol == "Base" for r in inherits)
 
+    def test_function_local_imports_stay_in_scope(self):
+        parser = TreeSitterSymbolParser("python")
+        code = """
+import json as j
+
+def outer():
+    import numpy as j
+    def inner():
+        j.array()
+    j.zeros()
+
+def sibling():
+    j.dumps()
+"""
+        result = parser.parse(code, Path("test.py"))
+
+        assert result is not None
+        calls = {
+            (r.source_symbol, r.target_symbol)
+            for r in result.relationships
+            if r.relationship_type.value == "calls"
+        }
+        assert ("inner", "numpy.array") in calls
+        assert ("outer", "numpy.zeros") in calls
+        assert ("sibling", "json.dumps") in calls
+
 
 @pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
 class TestTreeSitterJavaScriptParser:
@@ -267,6 +293,19 @@ class TestTreeSitterParserAvailability:
         # Rust not configured, so should not be available
         assert parser.is_available() is False
 
+    @pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+    def test_language_shared_between_instances(self):
+        first = TreeSitterSymbolParser("python")
+        second = TreeSitterSymbolParser("python")
+        assert first._language is second._language
+
+    @pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+    def test_tsx_uses_separate_language(self):
+        ts_parser = TreeSitterSymbolParser("typescript", Path("component.ts"))
+        tsx_parser = TreeSitterSymbolParser("typescript", Path("component.tsx"))
+        assert ts_parser.is_available() and tsx_parser.is_available()
+        assert ts_parser._language is not tsx_parser._language
+
 
 class TestTreeSitterParserFallback:
     """Tests for fallback behavior when tree-sitter unavailable."""
@@ -375,3 +414,105 @@ export class ExportedClass {
         # staticMethod, exportedFunc, ExportedClass, method
         # Should find at least 9 symbols
         assert len(result.symbols) >= 9
+
+    @pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+    def test_parse_symbols_match_symbol_only_walk(self):
+        samples = [
+            ("python", "test.py", """
+class Outer(Base):
+    class Inner:
+        def inner(self):
+            helper()
+
+    async def run(self):
+        def nested():
+            pass
+        return nested()
+"""),
+            ("javascript", "test.js", """
+import { a as b } from "mod";
+
+class Widget extends Base {
+    constructor() { super(); }
+    render() { return b(); }
+}
+
+const handler = () => render();
+function* gen() {}
+"""),
+        ]
+        for language_id, filename, code in samples:
+            parser = TreeSitterSymbolParser(language_id)
+            result = parser.parse(code, Path(filename))
+            assert result is not None
+            assert result.symbols == parser.parse_symbols(code)
+            assert result.relationships
+
+    @pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+    def test_relationship_strings_are_shared(self):
+        parser = TreeSitterSymbolParser("javascript")
+        code = """
+function first() { const a = require("shared-module"); a(); }
+function second() { const b = require("shared-module"); b(); }
+"""
+        result = parser.parse(code, Path("shared.js"))
+        assert result is not None
+
+        imports = [r for r in result.relationships if r.relationship_type.value == "imports"]
+        assert len(imports) == 2
+        assert imports[0].target_symbol is imports[1].target_symbol
+        assert all(r.source_file is result.path for r in result.relationships)
+
+    @pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+    def test_deeply_nested_code_does_not_hit_recursion_limit(self):
+        depth = 3000
+        samples = [
+            ("python", "deep.py", "def outer():\n    x = " + "(" * depth + "inner()" + ")" * depth + "\n"),
+            ("javascript", "deep.js", "function outer() { x = " + "(" * depth + "inner()" + ")" * depth + "; }\n"),
+        ]
+        for language_id, filename, code in samples:
+            result = TreeSitterSymbolParser(language_id).parse(code, Path(filename))
+            assert result is not None
+            assert [(r.source_symbol, r.target_symbol) for r in result.relationships] == [("outer", "inner")]
+
+    @pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+    def test_wide_named_import_fan_out_is_capped(self):
+        from codexlens.parsers import treesitter_parser
+
+        names = [f"n{i}" for i in range(treesitter_parser._MAX_NAMED_IMPORT_TARGETS + 10)]
+        code = "import { %s } from 'bundle';\n" % ", ".join(names)
+
+        parser = TreeSitterSymbolParser("javascript")
+        source_bytes, root = parser._parse_tree(code)
+        aliases, targets = parser._js_import_aliases_and_targets(source_bytes, root.children[0])
+
+        assert targets[0] == "bundle"
+        assert len(targets) == 1 + treesitter_parser._MAX_NAMED_IMPORT_TARGETS
+        assert aliases["n70"] == "bundle.n70"
+
+    @pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+    def test_files_without_scope_literals_skip_parsing(self, monkeypatch):
+        parser = TreeSitterSymbolParser("python")
+
+        def fail(text):
+            raise AssertionError("tree should not be built")
+
+        monkeypatch.setattr(parser, "_parse_tree", fail)
+
+        code = "import os\nVALUE = os.getenv('X')\n"
+        result = parser.parse(code, Path("settings.py"))
+        assert result is not None
+        assert result.symbols == []
+        assert result.relationships == []
+        assert parser.parse_symbols(code) == []
+
+
+class TestResolveSourceFile:
+    def test_returns_interned_resolved_path(self, tmp_path):
+        from codexlens.parsers.treesitter_parser import resolve_source_file
+
+        target = tmp_path / "module.py"
+        first = resolve_source_file(target)
+        second = resolve_source_file(target)
+        assert first == str(target.resolve())
+        assert first is second